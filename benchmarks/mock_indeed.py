@@ -0,0 +1,279 @@
+"""
+Local stand-in for the Indeed endpoints used by the backend mode
+Serves FindRCPMatches (GraphQL) and synthetic PDFs so throughput can be measured offline
+
+    python benchmarks/mock_indeed.py --port 8765 --candidates 5000 --latency 0.05 --error-rate 0.01
+
+Then point the downloader at it:
+    INDEED_GRAPHQL_URL=http://127.0.0.1:8765/graphql
+    INDEED_RESUME_URL=http://127.0.0.1:8765/api/catws/resume/v2/download?id={legacy_id}
+"""
+
+import json
+import time
+import hashlib
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+DISPOSITIONS = ["NEW", "PENDING", "PHONE_SCREENED", "INTERVIEWED", "OFFER_MADE", "REVIEWED"]
+DISPOSITION_WEIGHTS = [30, 25, 5, 5, 1, 34]
+RESULT_CAP = 3000  # Like Indeed: results past offset 3000 are never returned
+ERROR_STATUSES = [429, 500, 502, 503]
+
+FIRST_NAMES = ["Jean", "Marie", "Pierre", "Sophie", "Lucas", "Emma", "Hugo", "Lea", "Louis", "Chloe",
+               "Nathan", "Camille", "Thomas", "Sarah", "Karim", "Ines", "Yanis", "Julie", "Paul", "Manon"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+              "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier"]
+
+
+class MockIndeed:
+    """Synthetic jobs and candidates, with the behaviour the downloader depends on
+
+    Every job (ids job-1, job-2, ...) has `candidates` candidates with a disposition,
+    an apply date and a name. `cv_ratio` of them have a PDF resume, and `broken_url_rate`
+    of those have a downloadUrl answering 404 so the catws fallback gets exercised.
+    Each request waits `latency` seconds (+/- 50%) and fails with a 429/5xx with
+    probability `error_rate`.
+
+    Pages larger than `max_page_size` are rejected with a GraphQL error, only the
+    fields in the query's selection set are returned, and with `persisted_queries`
+    Apollo persisted queries (hash only) are accepted, otherwise they get the answer
+    of a gateway with them disabled (HTTP 200, "Must provide query string.").
+    """
+
+    def __init__(self, jobs: int = 1, candidates: int = 5000, cv_ratio: float = 0.9, broken_url_rate: float = 0.02,
+                 latency: float = 0.05, pdf_latency: float = 0.1, error_rate: float = 0.0, pdf_size: int = 40000,
+                 max_page_size: int = 1000, persisted_queries: bool = True, seed: int = 42):
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.persisted_queries = persisted_queries
+        self.stored_queries = {}  # sha256 -> query text
+        self.pdf_latency = pdf_latency
+        self.error_rate = error_rate
+        self.pdf_size = pdf_size
+        self.base_url = ''  # Set once the server is bound (absolute downloadUrl values)
+        self.requests = {'graphql': 0, 'graphql_bytes': 0, 'pdf': 0, 'fallback': 0, 'errors': 0}
+        self._lock = threading.Lock()
+
+        rng = random.Random(seed)
+        self.jobs = {}
+        self.by_legacy_id = {}
+        self.by_resume_id = {}
+        for j in range(1, jobs + 1):
+            job_id = f"job-{j}"
+            job_candidates = []
+            for i in range(candidates):
+                legacy_id = f"{j:03d}{i:07d}{rng.randrange(16 ** 6):06x}"
+                has_cv = rng.random() < cv_ratio
+                candidate = {
+                    'legacy_id': legacy_id,
+                    'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    'disposition': rng.choices(DISPOSITIONS, DISPOSITION_WEIGHTS)[0],
+                    'apply_date': candidates - i,  # i = 0 is the newest
+                    'resume_id': f"r{legacy_id}" if has_cv else None,
+                    'broken_url': has_cv and rng.random() < broken_url_rate,
+                }
+                job_candidates.append(candidate)
+                self.by_legacy_id[legacy_id] = candidate
+                if has_cv:
+                    self.by_resume_id[candidate['resume_id']] = candidate
+            self.jobs[job_id] = job_candidates
+
+    def _count(self, kind: str, amount: int = 1):
+        with self._lock:
+            self.requests[kind] += amount
+
+    def _delay(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds * random.uniform(0.5, 1.5))
+
+    def injected_error(self) -> int:
+        """HTTP status to fail this request with, or 0"""
+        if self.error_rate and random.random() < self.error_rate:
+            self._count('errors')
+            return random.choice(ERROR_STATUSES)
+        return 0
+
+    def resolve_query(self, payload: dict) -> tuple:
+        """Query text of a request, handling persisted queries: (query, error_status, error_body)"""
+        persisted = payload.get('extensions', {}).get('persistedQuery')
+        if not persisted:
+            return payload.get('query', ''), 0, None
+        if not self.persisted_queries:
+            if payload.get('query'):
+                return payload['query'], 0, None
+            return None, 200, {'errors': [{'message': 'Must provide query string.'}]}
+        digest = persisted.get('sha256Hash')
+        if payload.get('query'):
+            if hashlib.sha256(payload['query'].encode()).hexdigest() != digest:
+                return None, 400, {'errors': [{'message': 'provided sha does not match query'}]}
+            with self._lock:
+                self.stored_queries[digest] = payload['query']
+            return payload['query'], 0, None
+        query = self.stored_queries.get(digest)
+        if query is None:
+            return None, 200, {'errors': [{'message': 'PersistedQueryNotFound',
+                                           'extensions': {'code': 'PERSISTED_QUERY_NOT_FOUND'}}]}
+        return query, 0, None
+
+    def find_matches(self, variables: dict, query: str = '') -> dict:
+        """Answer a FindRCPMatches query with the fields its selection set asks for"""
+        self._count('graphql')
+        self._delay(self.latency)
+        params = variables.get('input', {})
+        if int(params.get('limit', 100)) > self.max_page_size:
+            return {'errors': [{'message': f"limit must be at most {self.max_page_size}"}], 'data': None}
+        context = params.get('context', {}).get('surfaceContext', [])
+        dispositions = {c['contextPayload'] for c in context if c['contextKey'] == 'DISPOSITION'} or set(DISPOSITIONS)
+        sort_by = next((c['contextPayload'] for c in context if c['contextKey'] == 'SORT_BY'), 'APPLY_DATE')
+        sort_order = next((c['contextPayload'] for c in context if c['contextKey'] == 'SORT_ORDER'), 'DESCENDING')
+        job_id = params.get('identifiers', {}).get('jobIdentifiers', {}).get('employerJobId')
+
+        pool = self.jobs.get(job_id) if job_id else [c for cands in self.jobs.values() for c in cands]
+        matched = [c for c in pool or [] if c['disposition'] in dispositions]
+        if sort_by == 'NAME':
+            matched.sort(key=lambda c: (c['name'], c['legacy_id']))
+        else:
+            matched.sort(key=lambda c: c['apply_date'])
+        if sort_order == 'DESCENDING':
+            matched.reverse()
+
+        offset = max(0, int(params.get('offset', 0)))
+        end = min(offset + int(params.get('limit', 100)), RESULT_CAP)
+        page = matched[offset:end] if offset < RESULT_CAP else []
+
+        result = {'overallMatchCount': len(matched)}
+        if 'matchConnection' in query or not query:
+            result['matchConnection'] = {'matches': [self._match(c, ids_only='profile' not in query and bool(query))
+                                                     for c in page]}
+            if 'hasNextPage' in query:
+                result['matchConnection']['pageInfo'] = {'hasNextPage': end < min(len(matched), RESULT_CAP)}
+        return {'data': {'findRCPMatches': result}}
+
+    def _match(self, candidate: dict, ids_only: bool = False) -> dict:
+        if ids_only:
+            return {'candidateSubmission': {'data': {'legacyID': candidate['legacy_id']}}}
+        resume = None
+        if candidate['resume_id']:
+            resume = {'id': candidate['resume_id'],
+                      'downloadUrl': f"{self.base_url}/resume/{candidate['resume_id']}.pdf"}
+        return {'candidateSubmission': {
+            'id': f"sub-{candidate['legacy_id']}",
+            'data': {
+                'profile': {'name': {'displayName': candidate['name']}},
+                'resume': resume,
+                'legacyID': candidate['legacy_id']
+            }
+        }}
+
+    def pdf(self, candidate: dict, fallback: bool = False) -> bytes:
+        """Synthetic PDF of pdf_size bytes, different for every resume"""
+        self._count('fallback' if fallback else 'pdf')
+        self._delay(self.pdf_latency)
+        header = f"%PDF-1.4\n% {candidate['name']} {candidate['legacy_id']}\n".encode()
+        return header + b'0' * max(0, self.pdf_size - len(header))
+
+
+def make_handler(mock: MockIndeed):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep-alive, like the real endpoints
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: bytes = b'', content_type: str = 'application/json'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if urlparse(self.path).path != '/graphql':
+                return self._send(404)
+            error = mock.injected_error()
+            if error:
+                return self._send(error, b'{}')
+            try:
+                payload = json.loads(body)
+            except json.JSONDecodeError:
+                return self._send(400, b'{"errors": [{"message": "invalid JSON"}]}')
+            if payload.get('operationName') != 'FindRCPMatches':
+                return self._send(200, json.dumps({'errors': [{'message': 'unknown operation'}]}).encode())
+            query, error_status, error_body = mock.resolve_query(payload)
+            if error_body:
+                return self._send(error_status, json.dumps(error_body).encode())
+            response = json.dumps(mock.find_matches(payload.get('variables', {}), query)).encode()
+            mock._count('graphql_bytes', len(body) + len(response))
+            self._send(200, response)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.startswith('/resume/') and url.path.endswith('.pdf'):
+                candidate = mock.by_resume_id.get(url.path[len('/resume/'):-len('.pdf')])
+                if candidate is None or candidate['broken_url']:
+                    return self._send(404)
+                fallback = False
+            elif url.path == '/api/catws/resume/v2/download':
+                candidate = mock.by_legacy_id.get(parse_qs(url.query).get('id', [''])[0])
+                if candidate is None or not candidate['resume_id']:
+                    return self._send(404)
+                fallback = True
+            else:
+                return self._send(404)
+            error = mock.injected_error()
+            if error:
+                return self._send(error)
+            self._send(200, mock.pdf(candidate, fallback), 'application/pdf')
+
+    return Handler
+
+
+def start_server(mock: MockIndeed, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """Serve `mock` from a background thread (port 0 = any free port)"""
+    server = ThreadingHTTPServer((host, port), make_handler(mock))
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    mock.base_url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the Indeed GraphQL and resume endpoints")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--jobs', type=int, default=1, help="Number of jobs (ids job-1, job-2, ...)")
+    parser.add_argument('--candidates', type=int, default=5000, help="Candidates per job")
+    parser.add_argument('--cv-ratio', type=float, default=0.9, help="Share of candidates with a PDF resume")
+    parser.add_argument('--broken-url-rate', type=float, default=0.02, help="Share of downloadUrl answering 404")
+    parser.add_argument('--latency', type=float, default=0.05, help="GraphQL response time in seconds (+/- 50%%)")
+    parser.add_argument('--pdf-latency', type=float, default=0.1, help="PDF response time in seconds (+/- 50%%)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests failing with 429/5xx")
+    parser.add_argument('--pdf-size', type=int, default=40000, help="Size of each PDF in bytes")
+    parser.add_argument('--max-page-size', type=int, default=1000, help="Largest limit accepted by FindRCPMatches")
+    parser.add_argument('--no-persisted-queries', action='store_true', help="Ignore persisted queries, like a gateway with APQ disabled")
+    args = parser.parse_args()
+
+    mock = MockIndeed(jobs=args.jobs, candidates=args.candidates, cv_ratio=args.cv_ratio,
+                      broken_url_rate=args.broken_url_rate, latency=args.latency, pdf_latency=args.pdf_latency,
+                      error_rate=args.error_rate, pdf_size=args.pdf_size, max_page_size=args.max_page_size,
+                      persisted_queries=not args.no_persisted_queries)
+    server = start_server(mock, args.host, args.port)
+    print(f"Mock Indeed sur {mock.base_url} ({args.jobs} job(s) x {args.candidates} candidats)")
+    print(f"   INDEED_GRAPHQL_URL={mock.base_url}/graphql")
+    print(f"   INDEED_RESUME_URL={mock.base_url}/api/catws/resume/v2/download?id={{legacy_id}}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\nRequetes: {mock.requests}")
+
+
+if __name__ == "__main__":
+    main()
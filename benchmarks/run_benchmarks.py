@@ -0,0 +1,204 @@
+"""
+Offline throughput benchmark of the backend mode against benchmarks/mock_indeed.py
+Runs candidate listing then CV downloads for each engine and concurrency setting
+
+    python benchmarks/run_benchmarks.py --engines threads,async --concurrency 10,50,100 --candidates 5000
+
+Each setting runs in its own process (clean peak RSS, fresh state database) and reports
+candidates/s (listing), CVs/s (downloads), p50/p99 request latency and peak RSS.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile, 0 for an empty list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB (None where the resource module is missing)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+def run_worker(config: dict):
+    """Benchmark one setting in this process and write the result to config['result_file']"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    sys.path.insert(0, str(REPO_DIR))
+    os.chdir(config['workdir'])
+    os.environ.update(config['env'])
+    import indeed_downloader
+
+    downloader = indeed_downloader.IndeedDownloader()
+    downloader.mode = 'backend'
+    downloader.api_key = downloader.ctk = 'bench'
+    downloader._jobs_running_concurrently = True  # No progress bars
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=config['concurrency'] * 2, max_retries=0)
+    session.mount('http://', adapter)
+    downloader.http = session
+    downloader.transport = 'direct'
+
+    # Every call to the mock reports its latency to the shared limiter
+    latencies = []
+    release = downloader.limiter.release
+
+    def timed_release(status, latency):
+        latencies.append(latency)
+        release(status, latency)
+    downloader.limiter.release = timed_release
+
+    job = indeed_downloader.JobContext(job_id='job-1', name='Benchmark')
+    downloader._create_job_folder(job)
+
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')  # The downloader's progress messages
+    try:
+        started = time.perf_counter()
+        candidates, _ = downloader._enumerate_candidates(job)
+        list_time = time.perf_counter() - started
+        list_latencies, latencies[:] = list(latencies), []
+
+        with_cv = [c for c in candidates if c['download_url']]
+        started = time.perf_counter()
+        downloaded = downloader._download_candidates_parallel(job, with_cv)
+        download_time = time.perf_counter() - started
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+        downloader.download_executor.shutdown(wait=True)
+        downloader.page_executor.shutdown(wait=True)
+        downloader.state.close()
+
+    result = {
+        'engine': config['engine'],
+        'concurrency': config['concurrency'],
+        'candidates': len(candidates),
+        'candidates_per_s': len(candidates) / list_time if list_time else 0,
+        'list_p50_ms': percentile(list_latencies, 50) * 1000,
+        'list_p99_ms': percentile(list_latencies, 99) * 1000,
+        'cvs': downloaded,
+        'cvs_expected': len(with_cv),
+        'cvs_per_s': downloaded / download_time if download_time else 0,
+        'download_p50_ms': percentile(latencies, 50) * 1000,
+        'download_p99_ms': percentile(latencies, 99) * 1000,
+        'api_calls': downloader.stats['api_calls'],
+        'retries': downloader.stats['retries'],
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    Path(config['result_file']).write_text(json.dumps(result))
+
+
+def run_setting(engine: str, concurrency: int, base_url: str, rate: float) -> Optional[dict]:
+    """Run one setting in a child process, returns its result (None if it crashed)"""
+    workdir = tempfile.mkdtemp(prefix='indeed-bench-')
+    env = {
+        'INDEED_GRAPHQL_URL': f"{base_url}/graphql",
+        'INDEED_RESUME_URL': f"{base_url}/api/catws/resume/v2/download?id={{legacy_id}}",
+        'DOWNLOAD_FOLDER': 'downloads',
+        'LOG_FOLDER': 'logs',
+        'TRANSPORT': 'direct',
+        'ENGINE': engine,
+        'PARALLEL_DOWNLOADS': str(concurrency),
+        'MAX_IN_FLIGHT': str(concurrency * 2),
+        'ASYNC_CONCURRENCY': str(concurrency),
+        'API_RATE_LIMIT': str(rate),
+        'SYNC_MODE': 'full',
+        'CV_STORE': 'off',
+    }
+    config = {'engine': engine, 'concurrency': concurrency, 'env': env, 'workdir': workdir,
+              'result_file': os.path.join(workdir, 'result.json')}
+    try:
+        subprocess.run([sys.executable, __file__, '--worker', json.dumps(config)], check=True)
+        return json.loads(Path(config['result_file']).read_text())
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        print(f"   ❌ {engine} x{concurrency}: {e}")
+        return None
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def print_results(results: list):
+    print()
+    print(f"{'engine':<8} {'conc':>5} {'cand/s':>8} {'p50':>7} {'p99':>7} {'CVs/s':>7} {'p50':>7} {'p99':>7} "
+          f"{'CVs':>11} {'retries':>7} {'RSS MB':>7}")
+    print(f"{'':<8} {'':>5} {'listing (ms)':>24} {'downloads (ms)':>22}")
+    print("-" * 92)
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.0f}" if r['peak_rss_mb'] is not None else "n/a"
+        print(f"{r['engine']:<8} {r['concurrency']:>5} {r['candidates_per_s']:>8.0f} {r['list_p50_ms']:>7.0f} "
+              f"{r['list_p99_ms']:>7.0f} {r['cvs_per_s']:>7.1f} {r['download_p50_ms']:>7.0f} "
+              f"{r['download_p99_ms']:>7.0f} {r['cvs']:>5}/{r['cvs_expected']:<5} {r['retries']:>7} {rss:>7}")
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--worker':
+        run_worker(json.loads(sys.argv[2]))
+        return
+
+    sys.path.insert(0, str(BENCH_DIR))
+    from mock_indeed import MockIndeed, start_server
+
+    parser = argparse.ArgumentParser(description="Offline benchmark of the backend mode against a local mock of Indeed")
+    parser.add_argument('--engines', default='threads,async', help="Comma-separated engines (threads, async)")
+    parser.add_argument('--concurrency', default='10,50', help="Comma-separated download concurrency settings")
+    parser.add_argument('--candidates', type=int, default=5000, help="Candidates in the benchmark job")
+    parser.add_argument('--cv-ratio', type=float, default=0.9, help="Share of candidates with a PDF resume")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mock GraphQL response time in seconds")
+    parser.add_argument('--pdf-latency', type=float, default=0.1, help="Mock PDF response time in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of mock requests failing with 429/5xx")
+    parser.add_argument('--pdf-size', type=int, default=40000, help="Size of each PDF in bytes")
+    parser.add_argument('--max-page-size', type=int, default=1000, help="Largest limit accepted by the mock")
+    parser.add_argument('--no-persisted-queries', action='store_true', help="Mock rejects persisted queries")
+    parser.add_argument('--rate', type=float, default=1000,
+                        help="API_RATE_LIMIT for the runs (high by default so the limiter does not cap the results)")
+    parser.add_argument('--json', help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    mock = MockIndeed(jobs=1, candidates=args.candidates, cv_ratio=args.cv_ratio, latency=args.latency,
+                      pdf_latency=args.pdf_latency, error_rate=args.error_rate, pdf_size=args.pdf_size,
+                      max_page_size=args.max_page_size, persisted_queries=not args.no_persisted_queries)
+    server = start_server(mock)
+    print(f"Mock Indeed sur {mock.base_url}: {args.candidates} candidats, latence {args.latency}s "
+          f"(PDF {args.pdf_latency}s), erreurs {args.error_rate:.0%}")
+
+    results = []
+    for engine in [e.strip() for e in args.engines.split(',') if e.strip()]:
+        for concurrency in [int(c) for c in args.concurrency.split(',') if c.strip()]:
+            print(f"   {engine} x{concurrency}...")
+            result = run_setting(engine, concurrency, mock.base_url, args.rate)
+            if result:
+                results.append(result)
+    server.shutdown()
+
+    print_results(results)
+    print(f"\nRequetes servies: {mock.requests}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
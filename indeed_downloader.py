@@ -9,26 +9,680 @@ import sys
 import json
 import time
 import re
+import argparse
+import asyncio
+import random
 import base64
+import hashlib
+import queue
+import shutil
+import sqlite3
+import threading
+import functools
 from urllib.parse import urlparse, parse_qs, unquote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from http.cookies import Morsel
+from contextlib import nullcontext, contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from dotenv import load_dotenv
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # Only needed for TRANSPORT=direct
+    requests = None
+
+try:
+    import aiohttp
+    from yarl import URL  # Installed with aiohttp
+except ImportError:  # Only needed for ENGINE=async
+    aiohttp = None
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        WebDriverException)
 import chromedriver_autoinstaller
 from tqdm import tqdm
 
 # Load environment variables
 load_dotenv('.env.config')
 
+# Overridable to point the downloader at a local stand-in (see benchmarks/mock_indeed.py)
+GRAPHQL_URL = os.getenv('INDEED_GRAPHQL_URL', "https://apis.indeed.com/graphql?co=FR&locale=fr-FR")
+RESUME_FALLBACK_URL = os.getenv('INDEED_RESUME_URL',
+                                "https://employers.indeed.com/api/catws/resume/v2/download?id={legacy_id}")
+GRAPHQL_HEADERS = {
+    "accept": "*/*",
+    "content-type": "application/json",
+    "indeed-client-sub-app": "talent-organization-modules",
+    "indeed-client-sub-app-component": "./CandidateListPage"
+}
+
+# FindRCPMatches selection sets: candidate data for listings, ids only, or just the count (probes)
+FIND_MATCHES_QUERIES = {
+    'full': """query FindRCPMatches($input: OrchestrationMatchesInput!) {
+  findRCPMatches(input: $input) {
+    overallMatchCount
+    matchConnection {
+      matches {
+        candidateSubmission {
+          data {
+            profile { name { displayName } }
+            resume {
+              ... on CandidatePdfResume { id, downloadUrl }
+            }
+            ... on IndeedApplyCandidateSubmission { legacyID }
+            ... on EmployerGeneratedCandidateSubmission { legacyID }
+          }
+        }
+      }
+    }
+  }
+}""",
+    'ids': """query FindRCPMatches($input: OrchestrationMatchesInput!) {
+  findRCPMatches(input: $input) {
+    overallMatchCount
+    matchConnection {
+      matches {
+        candidateSubmission {
+          data {
+            ... on IndeedApplyCandidateSubmission { legacyID }
+            ... on EmployerGeneratedCandidateSubmission { legacyID }
+          }
+        }
+      }
+    }
+  }
+}""",
+    'count': """query FindRCPMatches($input: OrchestrationMatchesInput!) {
+  findRCPMatches(input: $input) {
+    overallMatchCount
+  }
+}""",
+}
+PAGE_SIZE_CANDIDATES = (500, 250, 100)  # Limits tried, largest first, when PAGE_SIZE=auto
+PAGE_REFETCH_ROUNDS = 2  # Extra rounds for listing pages that failed or came back short
+DOWNLOAD_STABLE_SECONDS = 3  # Without a completion event, a download whose size has not changed for this long is complete
+
+
+TRANSIENT_STATUSES = {408, 425, 429, 500, 502, 503, 504}  # Worth retrying; None (no response) too
+JOB_STATUS_NAMES = {'open': 'ACTIVE', 'paused': 'PAUSED', 'closed': 'CLOSED'}  # CLI/env names -> Indeed statuses
+
+# Process exit codes (for cron/scripts)
+EXIT_OK = 0
+EXIT_FAILURES = 1      # Run completed but some CVs could not be downloaded
+EXIT_ERROR = 2         # Unexpected error
+EXIT_AUTH = 3          # Not logged in (saved cookies missing or expired in batch mode)
+EXIT_INTERRUPTED = 130  # Ctrl-C / SIGINT
+
+
+class RateLimiter:
+    """Adaptive limiter shared by every thread calling Indeed (token bucket + concurrency window, AIMD)"""
+
+    def __init__(self, rate: float, burst: int = 1, max_concurrency: int = 8, slow_latency: float = 10.0,
+                 cooldown: float = 5.0, decrease_interval: float = 2.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = max(0.2, rate / 20)
+        self.burst = max(1, burst)
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency = float(self.max_concurrency)
+        self.slow_latency = slow_latency
+        self.cooldown = cooldown
+        self.decrease_interval = decrease_interval
+        self.in_flight = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def _take(self, cost: int) -> Optional[float]:
+        """Take a slot and `cost` tokens if possible (lock held): 0, else seconds to wait (None = until a release)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.in_flight >= int(self.concurrency):
+            return None
+        if self._tokens >= 1:
+            self._tokens -= cost  # May go negative: large batches borrow on future tokens
+            self.in_flight += 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self, cost: int = 1):
+        """Wait for a free slot and `cost` tokens (a browser batch costs one token per CV)"""
+        with self._cond:
+            while True:
+                wait_time = self._take(cost)
+                if wait_time == 0:
+                    return
+                self._cond.wait(wait_time)
+
+    def try_acquire(self, cost: int = 1) -> float:
+        """Non-blocking acquire for the asyncio engine: 0 if acquired, else seconds to wait before retrying"""
+        with self._cond:
+            wait_time = self._take(cost)
+        return 0.05 if wait_time is None else wait_time
+
+    def release(self, status: Optional[int] = None, latency: float = 0.0):
+        """Free the slot and adapt rate/concurrency to the response (status None = no response)"""
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            congested = status is None or status in TRANSIENT_STATUSES or latency > self.slow_latency
+            if congested:
+                if status == 429:
+                    self._paused_until = max(self._paused_until, now + self.cooldown)
+                if now - self._last_decrease >= self.decrease_interval:
+                    self._last_decrease = now
+                    self.concurrency = max(1.0, self.concurrency / 2)
+                    self.rate = max(self.min_rate, self.rate / 2)
+            else:
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 50)
+            self._cond.notify_all()
+
+
+class LatencyHistogram:
+    """Request latencies per kind of request, as cumulative Prometheus histogram buckets (thread-safe)"""
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self._series = {}  # kind -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, kind: str, seconds: float):
+        with self._lock:
+            series = self._series.setdefault(kind, [0] * (len(self.BUCKETS) + 1) + [0.0])
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    series[i] += 1
+            series[len(self.BUCKETS)] += 1
+            series[-1] += seconds
+
+    def render(self, name: str) -> list:
+        """Lines of the histogram in the Prometheus text format"""
+        lines = [f"# HELP {name} Latency of the requests to Indeed, per kind of request",
+                 f"# TYPE {name} histogram"]
+        with self._lock:
+            series = {kind: list(values) for kind, values in self._series.items()}
+        for kind, values in sorted(series.items()):
+            for bound, count in zip(self.BUCKETS, values):
+                lines.append(f'{name}_bucket{{kind="{kind}",le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{kind="{kind}",le="+Inf"}} {values[len(self.BUCKETS)]}')
+            lines.append(f'{name}_sum{{kind="{kind}"}} {values[-1]:.6f}')
+            lines.append(f'{name}_count{{kind="{kind}"}} {values[len(self.BUCKETS)]}')
+        return lines
+
+
+class Profiler:
+    """Timings of the run's phases and hot-path operations, optionally traced as JSON lines (thread-safe)"""
+
+    def __init__(self, enabled: bool = True, trace_path: Path = None):
+        self.enabled = enabled
+        self.started = time.time()
+        self._samples = {}  # name -> [seconds, ...]
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._trace = open(trace_path, 'a', encoding='utf-8') if enabled and trace_path else None
+
+    def record(self, name: str, seconds: float, **fields):
+        """Add one timing sample"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._samples.setdefault(name, []).append(seconds)
+            if self._trace:
+                event = {'t': round(time.time() - self.started, 4), 'name': name, 'ms': round(seconds * 1000, 2),
+                         'thread': threading.current_thread().name, **fields}
+                self._trace.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    @contextmanager
+    def span(self, name: str, **fields):
+        """Time the enclosed block as one sample of `name`"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, **fields)
+
+    def count(self, name: str, amount: int = 1):
+        """Increment a counter (HTTP statuses, timeouts...)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def summary(self) -> dict:
+        """{'timings': {name: count/total/percentiles}, 'counters': {...}}, slowest totals first"""
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            counters = dict(self._counters)
+
+        def pct(values: list, p: float) -> float:
+            return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))] * 1000
+
+        timings = {}
+        for name, values in sorted(samples.items(), key=lambda item: -sum(item[1])):
+            timings[name] = {
+                'count': len(values),
+                'total_s': round(sum(values), 3),
+                'mean_ms': round(sum(values) / len(values) * 1000, 2),
+                'p50_ms': round(pct(values, 50), 2),
+                'p90_ms': round(pct(values, 90), 2),
+                'p99_ms': round(pct(values, 99), 2),
+                'max_ms': round(values[-1] * 1000, 2),
+            }
+        return {'timings': timings, 'counters': counters}
+
+    def close(self):
+        with self._lock:
+            if self._trace:
+                self._trace.close()
+                self._trace = None
+
+
+def clean_candidate_name(name: str) -> str:
+    """Normalized candidate name used for name-based matching ("Jean Dupont!" -> "jean dupont")"""
+    return "".join(ch for ch in name if ch.isalnum() or ch in (' ', '-', '_')).strip().lower()
+
+
+class StateStore:
+    """Local state database (SQLite, WAL mode): one row per job folder and per candidate, also the retry queue"""
+
+    def __init__(self, db_path: Path, legacy_json: Path = None, flush_every: int = 50, flush_interval: float = 5.0):
+        self.db_path = Path(db_path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._last_flush = time.time()
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # fsync on WAL checkpoints, not on every commit
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                folder TEXT PRIMARY KEY,
+                job_id TEXT,
+                title TEXT,
+                job_date TEXT,
+                total_announced INTEGER,
+                total_recovered INTEGER,
+                processed INTEGER,
+                watermark_id TEXT,  -- newest legacy_id seen, where incremental syncs stop
+                synced_at REAL,
+                completed_at REAL,
+                updated_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_job_id ON jobs(job_id);
+
+            CREATE TABLE IF NOT EXISTS candidates (
+                folder TEXT NOT NULL,
+                candidate_key TEXT NOT NULL,  -- legacy_id, or "name:<clean name>" when the id is unknown
+                legacy_id TEXT,
+                name TEXT,
+                clean_name TEXT,
+                resume_id TEXT,
+                status TEXT NOT NULL,
+                file_path TEXT,
+                size INTEGER,
+                sha256 TEXT,  -- content hash when the CV is in the CV store
+                download_url TEXT,
+                attempts INTEGER DEFAULT 0,  -- failed download attempts
+                last_error TEXT,
+                created_at REAL,
+                updated_at REAL,
+                PRIMARY KEY (folder, candidate_key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_candidates_legacy_id ON candidates(legacy_id);
+            CREATE INDEX IF NOT EXISTS idx_candidates_clean_name ON candidates(folder, clean_name);
+            CREATE INDEX IF NOT EXISTS idx_candidates_status ON candidates(folder, status);
+
+            CREATE TABLE IF NOT EXISTS completed_jobs (job_id TEXT PRIMARY KEY);
+        """)
+        # Columns added after the first release of the database
+        added_columns = {
+            'candidates': (('download_url', 'TEXT'), ('attempts', 'INTEGER DEFAULT 0'), ('last_error', 'TEXT'),
+                           ('sha256', 'TEXT')),
+            'jobs': (('watermark_id', 'TEXT'), ('synced_at', 'REAL')),
+        }
+        for table, new_columns in added_columns.items():
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for column, definition in new_columns:
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        self.conn.commit()
+
+        if legacy_json:
+            self._migrate_json(Path(legacy_json))
+
+        self.downloaded_ids = {row[0] for row in self.conn.execute(
+            "SELECT legacy_id FROM candidates WHERE status = 'downloaded' AND legacy_id IS NOT NULL")}
+        self.downloaded_names = {row[0] for row in self.conn.execute(
+            "SELECT name FROM candidates WHERE status = 'downloaded' AND name IS NOT NULL")}
+        self.completed_jobs = {row[0] for row in self.conn.execute("SELECT job_id FROM completed_jobs")}
+        self.resume_blobs = {row[0]: row[1] for row in self.conn.execute(
+            "SELECT resume_id, sha256 FROM candidates WHERE sha256 IS NOT NULL AND resume_id IS NOT NULL")}
+        self.known_folders = {row[0] for row in self.conn.execute("SELECT folder FROM jobs")}
+
+    def _migrate_json(self, json_file: Path):
+        """One-time import of the old checkpoint_unified.json, renamed to *.migrated afterwards
+
+        Its ids and names are not attached to a job, so they are stored under folder ''.
+        """
+        if not json_file.exists():
+            return
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO candidates (folder, candidate_key, legacy_id, status, created_at, updated_at) "
+                "VALUES ('', ?, ?, 'downloaded', ?, ?)",
+                [(i, i, now, now) for i in data.get('downloaded_ids', []) if i])
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO candidates (folder, candidate_key, name, clean_name, status, created_at, updated_at) "
+                "VALUES ('', ?, ?, ?, 'downloaded', ?, ?)",
+                [(f"name:{clean_candidate_name(n)}", n, clean_candidate_name(n), now, now)
+                 for n in data.get('downloaded_names', []) if n])
+            self.conn.executemany("INSERT OR IGNORE INTO completed_jobs VALUES (?)",
+                                  [(j,) for j in data.get('completed_jobs', []) if j])
+            self.conn.commit()
+        json_file.rename(json_file.with_name(json_file.name + '.migrated'))
+        print(f"   Checkpoint migre vers {self.db_path.name}")
+
+    def import_folder(self, folder: Path):
+        """One-time import of a job folder created before the state database
+
+        Reads stats.json, checkpoint.json, no_cv.txt and the PDF names
+        ("Jean Dupont_20251126_154317.pdf"). PDFs have no legacy_id, so they are keyed by name.
+        """
+        now = time.time()
+        rows = []
+        for pdf_file in folder.glob('*.pdf'):
+            name_part = pdf_file.stem.rsplit('_', 2)[0]
+            clean = clean_candidate_name(name_part)
+            if clean:
+                rows.append((folder.name, f"name:{clean}", None, name_part, clean, 'downloaded',
+                             str(pdf_file), pdf_file.stat().st_size, pdf_file.stat().st_mtime, now))
+
+        no_cv_file = folder / 'no_cv.txt'
+        if no_cv_file.exists():
+            with open(no_cv_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    name = line.strip()
+                    clean = clean_candidate_name(name)
+                    if clean:
+                        rows.append((folder.name, f"name:{clean}", None, name, clean, 'no_cv', None, None, now, now))
+
+        checkpoint_file = folder / 'checkpoint.json'
+        if checkpoint_file.exists():
+            try:
+                with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                    for legacy_id in json.load(f).get('downloaded_ids', []):
+                        if legacy_id:
+                            rows.append((folder.name, legacy_id, legacy_id, None, None, 'downloaded', None, None, now, now))
+            except (json.JSONDecodeError, IOError):
+                pass
+
+        stats = {}
+        stats_file = folder / 'stats.json'
+        if stats_file.exists():
+            try:
+                with open(stats_file, 'r', encoding='utf-8') as f:
+                    stats = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                pass
+
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO candidates (folder, candidate_key, legacy_id, name, clean_name, status, "
+                "file_path, size, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.conn.execute(
+                "INSERT OR IGNORE INTO jobs (folder, total_announced, total_recovered, processed, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (folder.name, stats.get('total_announced'), stats.get('total_recovered'), stats.get('processed'), now))
+            self.conn.commit()
+            self.known_folders.add(folder.name)
+            for row in rows:
+                if row[5] == 'downloaded':
+                    if row[2]:
+                        self.downloaded_ids.add(row[2])
+                    if row[3]:
+                        self.downloaded_names.add(row[3])
+
+    def upsert_job(self, folder: str, **fields):
+        """Create or update a job row (job_id, title, job_date, total_announced, total_recovered, processed,
+        watermark_id, synced_at)
+
+        None values are ignored so a partial update never erases known data.
+        """
+        fields = {k: v for k, v in fields.items() if v is not None}
+        fields['updated_at'] = time.time()
+        columns = ', '.join(fields)
+        placeholders = ', '.join('?' for _ in fields)
+        updates = ', '.join(f"{k} = excluded.{k}" for k in fields)
+        with self._lock:
+            self.conn.execute(
+                f"INSERT INTO jobs (folder, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT(folder) DO UPDATE SET {updates}",
+                (folder, *fields.values()))
+            self.known_folders.add(folder)
+            self._mark_dirty()
+
+    def record_candidate(self, folder: str, status: str, name: str = None, legacy_id: str = None,
+                         resume_id: str = None, file_path: Path = None, size: int = None, sha256: str = None):
+        """Insert or update the state of one candidate of a job (thread-safe)"""
+        clean = clean_candidate_name(name) if name else None
+        key = legacy_id or f"name:{clean}"
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO candidates (folder, candidate_key, legacy_id, name, clean_name, resume_id, status, "
+                "file_path, size, sha256, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(folder, candidate_key) DO UPDATE SET status = excluded.status, "
+                "name = COALESCE(excluded.name, name), clean_name = COALESCE(excluded.clean_name, clean_name), "
+                "resume_id = COALESCE(excluded.resume_id, resume_id), file_path = COALESCE(excluded.file_path, file_path), "
+                "size = COALESCE(excluded.size, size), sha256 = COALESCE(excluded.sha256, sha256), "
+                "updated_at = excluded.updated_at",
+                (folder, key, legacy_id, name, clean, resume_id, status,
+                 str(file_path) if file_path else None, size, sha256, now, now))
+            if status == 'downloaded':
+                if legacy_id:
+                    self.downloaded_ids.add(legacy_id)
+                if name:
+                    self.downloaded_names.add(name)
+                if resume_id and sha256:
+                    self.resume_blobs[resume_id] = sha256
+            self._mark_dirty()
+
+    def record_failure(self, folder: str, candidate: dict, error: str) -> int:
+        """Queue a failed download for retry, returns its number of failed attempts
+
+        A candidate already downloaded (e.g. by another job sharing it) is left alone.
+        """
+        now = time.time()
+        name = candidate.get('name')
+        clean = clean_candidate_name(name) if name else None
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO candidates (folder, candidate_key, legacy_id, name, clean_name, resume_id, status, "
+                "download_url, attempts, last_error, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'failed', ?, 1, ?, ?, ?) "
+                "ON CONFLICT(folder, candidate_key) DO UPDATE SET status = 'failed', "
+                "attempts = COALESCE(attempts, 0) + 1, last_error = excluded.last_error, "
+                "download_url = COALESCE(excluded.download_url, download_url), "
+                "resume_id = COALESCE(excluded.resume_id, resume_id), updated_at = excluded.updated_at "
+                "WHERE status != 'downloaded'",
+                (folder, candidate['legacy_id'], candidate['legacy_id'], name, clean, candidate.get('resume_id'),
+                 candidate.get('download_url'), error, now, now))
+            self._mark_dirty()
+            row = self.conn.execute("SELECT attempts FROM candidates WHERE folder = ? AND candidate_key = ?",
+                                    (folder, candidate['legacy_id'])).fetchone()
+            return row[0] if row else 0
+
+    def failed_candidates(self, folder: str = None, statuses: tuple = ('failed',)) -> list:
+        """Queued failed downloads as candidate dicts (plus 'folder', 'attempts', 'last_error')"""
+        placeholders = ', '.join('?' for _ in statuses)
+        query = (f"SELECT folder, legacy_id, name, resume_id, download_url, attempts, last_error FROM candidates "
+                 f"WHERE status IN ({placeholders}) AND legacy_id IS NOT NULL")
+        params = list(statuses)
+        if folder is not None:
+            query += " AND folder = ?"
+            params.append(folder)
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(query + " ORDER BY folder, updated_at", params)]
+
+    def set_failed_status(self, folder: str, legacy_ids: list, status: str, reset_attempts: bool = False):
+        """Move failed downloads between the retry queue ('failed') and the dead letter ('dead')"""
+        attempts = ", attempts = 0" if reset_attempts else ""
+        with self._lock:
+            self.conn.executemany(
+                f"UPDATE candidates SET status = ?{attempts}, updated_at = ? "
+                f"WHERE folder = ? AND candidate_key = ? AND status IN ('failed', 'dead')",
+                [(status, time.time(), folder, legacy_id) for legacy_id in legacy_ids])
+            self.conn.commit()
+
+    def mark_job_completed(self, job_id: str):
+        """Mark a job as completed"""
+        with self._lock:
+            if job_id and job_id not in self.completed_jobs:
+                self.completed_jobs.add(job_id)
+                self.conn.execute("INSERT OR IGNORE INTO completed_jobs VALUES (?)", (job_id,))
+                self.conn.execute("UPDATE jobs SET completed_at = ? WHERE job_id = ?", (time.time(), job_id))
+                self._mark_dirty()
+
+    def job_row(self, folder: str) -> dict:
+        """Stored row of one job folder ({} if unknown)"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM jobs WHERE folder = ?", (folder,)).fetchone()
+            return dict(row) if row else {}
+
+    def candidate_ids(self, folder: str) -> set:
+        """legacy_ids of every candidate recorded for a job, whatever their status"""
+        with self._lock:
+            return {row[0] for row in self.conn.execute(
+                "SELECT legacy_id FROM candidates WHERE folder = ? AND legacy_id IS NOT NULL", (folder,))}
+
+    def processed_index(self, folder: str) -> tuple:
+        """Identity index of the candidates already handled in a job (CV downloaded or no CV)
+
+        Returns (legacy_ids, resume_ids, unmatched_names). unmatched_names are the clean
+        names of rows imported from PDF file names / no_cv.txt, which carry no id yet.
+        """
+        legacy_ids, resume_ids, unmatched_names = set(), set(), set()
+        with self._lock:
+            for row in self.conn.execute(
+                    "SELECT candidate_key, legacy_id, resume_id, clean_name FROM candidates "
+                    "WHERE folder = ? AND status IN ('downloaded', 'no_cv')", (folder,)):
+                if row['legacy_id']:
+                    legacy_ids.add(row['legacy_id'])
+                if row['resume_id']:
+                    resume_ids.add(row['resume_id'])
+                if row['candidate_key'].startswith('name:') and row['clean_name']:
+                    unmatched_names.add(row['clean_name'])
+        return legacy_ids, resume_ids, unmatched_names
+
+    def adopt_name_row(self, folder: str, clean_name: str, candidate: dict):
+        """Attach a candidate's ids to a row imported by name, so later runs match it by id"""
+        with self._lock:
+            row = self.conn.execute("SELECT status FROM candidates WHERE folder = ? AND candidate_key = ?",
+                                    (folder, f"name:{clean_name}")).fetchone()
+            if not row:
+                return
+            self.conn.execute(
+                "UPDATE OR IGNORE candidates SET candidate_key = ?, legacy_id = ?, "
+                "resume_id = COALESCE(resume_id, ?), updated_at = ? WHERE folder = ? AND candidate_key = ?",
+                (candidate['legacy_id'], candidate['legacy_id'], candidate.get('resume_id'), time.time(),
+                 folder, f"name:{clean_name}"))
+            if row['status'] == 'downloaded':
+                self.downloaded_ids.add(candidate['legacy_id'])
+            self._mark_dirty()
+
+    def job_summaries(self) -> dict:
+        """Per-folder counts and stats: {folder: {'downloaded', 'no_cv', 'failed', 'dead', 'total_announced', ...}}"""
+        with self._lock:
+            summaries = {row['folder']: dict(row) for row in self.conn.execute("SELECT * FROM jobs")}
+            for folder in summaries.values():
+                folder.update({'downloaded': 0, 'no_cv': 0, 'failed': 0, 'dead': 0})
+            for row in self.conn.execute(
+                    "SELECT folder, status, COUNT(*) AS n FROM candidates WHERE folder != '' GROUP BY folder, status"):
+                if row['folder'] in summaries:
+                    summaries[row['folder']][row['status']] = row['n']
+            return summaries
+
+    def _mark_dirty(self):
+        """Count a buffered write and commit once the batch is full or old enough"""
+        self._pending += 1
+        if self._pending >= self.flush_every or time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Commit buffered writes"""
+        with self._lock:
+            if self._pending:
+                self.conn.commit()
+                self._pending = 0
+            self._last_flush = time.time()
+
+    def close(self):
+        """Flush, compact the WAL into the main database and close"""
+        with self._lock:
+            if self.conn is None:
+                return
+            self.flush()
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.close()
+            self.conn = None
+
+
+class JobContext:
+    """State of one job being processed
+
+    Passed explicitly to every job-level method so several jobs can run at once.
+    """
+
+    def __init__(self, job_id: str = None, name: str = None, folder: Path = None):
+        self.job_id = job_id
+        self.name = name
+        self.folder = folder  # None: CVs go to the downloads root
+        self.is_existing = False  # True if job folder already existed
+        self.listing_failures = 0  # Listing pages still failing after retries (the listing is incomplete)
+
+    @property
+    def folder_key(self) -> str:
+        """Key of this job in the state database"""
+        return self.folder.name if self.folder else ''
+
+
+class BrowserContext:
+    """One Chrome instance driven by frontend mode, with its own download folder
+
+    Passed explicitly to the frontend methods so several browsers can work on
+    different jobs at once without mixing up their downloads.
+    """
+
+    def __init__(self, driver, download_dir: Path):
+        self.driver = driver
+        self.download_dir = download_dir
+
 
 class IndeedDownloader:
     def __init__(self):
@@ -36,13 +690,42 @@ class IndeedDownloader:
         self.download_folder = os.getenv('DOWNLOAD_FOLDER', 'downloads')
         self.log_folder = os.getenv('LOG_FOLDER', 'logs')
         self.max_cvs = int(os.getenv('MAX_CVS', 3000))
-        self.parallel_downloads = int(os.getenv('PARALLEL_DOWNLOADS', 10))
-        self.download_delay = float(os.getenv('DOWNLOAD_DELAY', 0.5))
-        self.next_candidate_delay = float(os.getenv('NEXT_CANDIDATE_DELAY', 1.0))
+        self.parallel_downloads = max(1, int(os.getenv('PARALLEL_DOWNLOADS', 10)))
+        self.max_in_flight = max(self.parallel_downloads, int(os.getenv('MAX_IN_FLIGHT', self.parallel_downloads * 2)))
+        self.download_batch_size = max(1, int(os.getenv('DOWNLOAD_BATCH_SIZE', 25)))  # CVs per browser round-trip
+        self.batch_concurrency = max(1, int(os.getenv('BATCH_CONCURRENCY', 6)))  # Concurrent fetches inside the page
+        self.script_timeout = float(os.getenv('SCRIPT_TIMEOUT', 120))
+        self.transport = os.getenv('TRANSPORT', 'browser').lower()  # 'browser' or 'direct' (HTTP, backend mode)
+        self.http_timeout = float(os.getenv('HTTP_TIMEOUT', 60))
+        self.pdf_transfer = os.getenv('PDF_TRANSFER', 'save').lower()  # 'save' (Chrome writes to disk) or 'inline' (base64)
+        self.download_verify_timeout = float(os.getenv('DOWNLOAD_VERIFY_TIMEOUT', 30))
+        self.download_retry_rounds = max(0, int(os.getenv('DOWNLOAD_RETRY_ROUNDS', 2)))  # End-of-job retries of failed CVs
+        self.download_retry_delay = float(os.getenv('DOWNLOAD_RETRY_DELAY', 10))  # Seconds before the first round
+        self.cv_store = os.getenv('CV_STORE', 'off').lower()  # 'off', 'hardlink' or 'symlink' (store CVs once)
+        self.enum_concurrency = max(1, int(os.getenv('ENUM_CONCURRENCY', 4)))  # Listing passes and pages in parallel
+        self.api_rate = float(os.getenv('API_RATE_LIMIT', 10))  # Max requests per second to Indeed (GraphQL + CVs)
+        self.engine = os.getenv('ENGINE', 'threads').lower()  # 'threads' or 'async' (aiohttp, backend mode)
+        self.async_concurrency = max(1, int(os.getenv('ASYNC_CONCURRENCY', 100)))  # CVs in flight with ENGINE=async
+        default_concurrency = (self.async_concurrency if self.engine == 'async' else self.parallel_downloads) + self.enum_concurrency
+        self.request_concurrency = max(1, int(os.getenv('REQUEST_CONCURRENCY', default_concurrency)))
+        self.max_retries = max(0, int(os.getenv('MAX_RETRIES', 4)))  # Retries on 429/5xx/network errors
+        self.retry_backoff = float(os.getenv('RETRY_BACKOFF', 1.0))  # Base of the jittered exponential backoff (seconds)
+        self.slow_response = float(os.getenv('SLOW_RESPONSE', 15))  # Slower responses count as congestion (seconds)
+        self.planner_min_yield = float(os.getenv('PLANNER_MIN_YIELD', 0.02))  # Stop a slice family below this new/fetched ratio
+        page_size = os.getenv('PAGE_SIZE', 'auto').lower()  # Candidates per listing request, 'auto' = probed
+        self.page_size = None if page_size == 'auto' else max(1, int(page_size))
+        self._page_size_lock = threading.Lock()
+        self.persisted_queries = os.getenv('GRAPHQL_PERSISTED', 'auto').lower()  # 'auto' (when supported) or 'off'
+        self._persisted_hashes = set()  # Query hashes registered with the server this run
+        self.sync_mode = os.getenv('SYNC_MODE', 'full').lower()  # 'full' or 'incremental' (new candidates only)
+        self.page_wait_timeout = float(os.getenv('PAGE_WAIT_TIMEOUT', 15))  # Budget of one browser wait (seconds)
 
         # Create folders
         Path(self.download_folder).mkdir(exist_ok=True)
         Path(self.log_folder).mkdir(exist_ok=True)
+        self.staging_folder = Path(self.log_folder) / 'staging'  # Chrome downloads land here before being renamed
+        self.dead_letter_file = Path(self.log_folder) / 'dead_letter.jsonl'  # CVs given up after all retries
+        self.store_folder = Path(self.download_folder) / '.store'  # Content-addressed CVs (CV_STORE)
 
         # Session state
         self.driver = None
@@ -50,16 +733,16 @@ class IndeedDownloader:
         self.api_key = None
         self.ctk = None
         self.cookies = {}
-
-        # Current job info
-        self.current_job_id = None
-        self.current_job_name = None
-        self.current_job_folder = None
-        self.current_job_is_existing = False  # True if job folder already existed
+        self.http = None  # Pooled requests.Session (TRANSPORT=direct)
+        self.browser = None  # Frontend context of the main Chrome window
+        self._staging_enabled = False
 
         # Checkpoint
-        self.checkpoint_file = Path(self.log_folder) / 'checkpoint_unified.json'
-        self.checkpoint_data = self._load_checkpoint()
+        self.state = StateStore(
+            Path(self.log_folder) / 'state.db',
+            legacy_json=Path(self.log_folder) / 'checkpoint_unified.json',
+            flush_every=int(os.getenv('CHECKPOINT_FLUSH_EVERY', 50))
+        )
 
         # Stats
         self.stats = {
@@ -67,38 +750,86 @@ class IndeedDownloader:
             'downloaded': 0,
             'skipped': 0,
             'failed': 0,
-            'archived': 0  # Jobs with no candidates (too old/archived)
+            'archived': 0,  # Jobs with no candidates (too old/archived)
+            'api_calls': 0,  # GraphQL requests sent
+            'retries': 0,  # Calls retried after a 429/5xx/network error
+            'reused': 0,  # CVs linked from the CV store without downloading
+            'deduplicated': 0,  # Downloaded CVs identical to one already stored
+            'bytes_written': 0,  # Size of the CVs downloaded
+            'jobs_completed': 0  # Jobs whose listing and downloads ran to the end (both modes)
         }
         self.job_stats = []  # List of {job_name, downloaded, skipped, no_cv, total}
+        self._failed_this_run = set()  # legacy_ids counted in stats['failed'] and queued for a retry
+        self.job_concurrency = max(1, int(os.getenv('JOB_CONCURRENCY', 3)))  # Jobs processed at once (backend mode)
+        self.frontend_browsers = max(1, int(os.getenv('FRONTEND_BROWSERS', 1)))  # Chrome instances (frontend, all jobs)
         self.start_time = None
 
-        # Mode settings
-        self.mode = None  # 'backend' or 'frontend'
+        # Locks for parallel downloads (backend mode)
+        self._stats_lock = threading.Lock()
+        self._driver_lock = threading.RLock()  # WebDriver sessions are not thread-safe
+        self._dead_letter_lock = threading.Lock()
+        self._store_lock = threading.Lock()
+        # One limiter for every call to Indeed (GraphQL and CV downloads), all jobs included
+        self.limiter = RateLimiter(self.api_rate, burst=self.enum_concurrency,
+                                   max_concurrency=self.request_concurrency, slow_latency=self.slow_response)
+        # Download workers shared by all jobs, so concurrent jobs stay within PARALLEL_DOWNLOADS
+        self.download_executor = ThreadPoolExecutor(max_workers=self.parallel_downloads)
+        # Listing pages fetched concurrently, shared by all passes so ENUM_CONCURRENCY bounds listing calls
+        self.page_executor = ThreadPoolExecutor(max_workers=self.enum_concurrency)
+        self._jobs_running_concurrently = False  # Per-job progress bars are hidden when True
+        self._cancel = threading.Event()  # Set on Ctrl-C so worker threads and the asyncio engine wind down
+        # Per-phase timings: logs/profile_<date>.json at the end, plus a JSON-lines trace with PROFILE=trace
+        self.profile = os.getenv('PROFILE', 'summary').lower()  # 'off', 'summary' or 'trace'
+        run_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.profile_file = Path(self.log_folder) / f"profile_{run_stamp}.json"
+        # Live metrics (Prometheus text format) on http://METRICS_HOST:METRICS_PORT/metrics, off when 0
+        self.metrics_port = int(os.getenv('METRICS_PORT', 0))
+        self.metrics_host = os.getenv('METRICS_HOST', '127.0.0.1')
+        self.metrics_server = None
+        self.request_latency = LatencyHistogram()
+        self._active_jobs = {}  # job_id -> name, jobs being downloaded
+        self._download_queues = {}  # job_id -> queue of candidates waiting for a download worker
+        self.profiler = Profiler(enabled=self.profile != 'off',
+                                 trace_path=Path(self.log_folder) / f"trace_{run_stamp}.jsonl" if self.profile == 'trace' else None)
+
+        # Mode settings (asked in the menu unless preset by the command line or the environment)
+        self.mode = os.getenv('DOWNLOAD_MODE', '').lower() or None  # 'backend' or 'frontend'
         self.job_mode = None  # 'single' or 'all'
-        self.job_statuses = []  # ['ACTIVE', 'PAUSED', 'CLOSED']
-
-    def _load_checkpoint(self) -> dict:
-        """Load checkpoint data"""
-        if self.checkpoint_file.exists():
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {
-            'downloaded_names': [],
-            'downloaded_ids': [],
-            'completed_jobs': []
-        }
-
-    def _save_checkpoint(self, name: str = None, legacy_id: str = None, job_id: str = None):
-        """Save checkpoint"""
-        if name and name not in self.checkpoint_data['downloaded_names']:
-            self.checkpoint_data['downloaded_names'].append(name)
-        if legacy_id and legacy_id not in self.checkpoint_data['downloaded_ids']:
-            self.checkpoint_data['downloaded_ids'].append(legacy_id)
-        if job_id and job_id not in self.checkpoint_data['completed_jobs']:
-            self.checkpoint_data['completed_jobs'].append(job_id)
-
-        with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(self.checkpoint_data, f, ensure_ascii=False, indent=2)
+        self.job_statuses = self._parse_job_statuses(os.getenv('JOB_STATUSES', ''))  # ['ACTIVE', 'PAUSED', 'CLOSED']
+        self.job_ids = [j.strip() for j in os.getenv('JOB_IDS', '').split(',') if j.strip()]  # Only these jobs
+        self.existing_jobs_policy = os.getenv('EXISTING_JOBS', 'ask').lower()  # 'ask', 'skip', 'new' or 'all'
+        self.headless = os.getenv('HEADLESS', 'false').lower() in ('1', 'true', 'yes')
+        self.interactive = True  # False in batch mode: no menu, prompts or login window
+
+    @staticmethod
+    def _parse_job_statuses(value: str) -> list:
+        """Parse 'open,paused' (or 'ACTIVE,PAUSED') into Indeed job statuses"""
+        statuses = []
+        for name in value.split(','):
+            name = name.strip()
+            status = JOB_STATUS_NAMES.get(name.lower(), name.upper())
+            if status in JOB_STATUS_NAMES.values() and status not in statuses:
+                statuses.append(status)
+        return statuses
+
+    def _save_checkpoint(self, job: JobContext = None, name: str = None, legacy_id: str = None,
+                         resume_id: str = None, file_path: Path = None, job_id: str = None, sha256: str = None):
+        """Save checkpoint (thread-safe, batched commits)
+
+        Records a downloaded CV for the job folder and/or marks a job as completed.
+        """
+        if name or legacy_id:
+            folder = job.folder_key if job else ''
+            size = file_path.stat().st_size if file_path else None
+            self.state.record_candidate(folder, 'downloaded', name=name, legacy_id=legacy_id,
+                                        resume_id=resume_id, file_path=file_path, size=size, sha256=sha256)
+        if job_id:
+            self.state.mark_job_completed(job_id)
+
+    def _inc_stat(self, key: str, amount: int = 1):
+        """Increment a global stat counter (thread-safe)"""
+        with self._stats_lock:
+            self.stats[key] += amount
 
     def show_menu(self):
         """Display main menu and get user choices"""
@@ -109,41 +840,43 @@ class IndeedDownloader:
 """)
 
         # Mode selection
-        print("📥 MODE DE TÉLÉCHARGEMENT:")
-        print("   1. Backend (API) - Plus rapide, téléchargements parallèles")
-        print("   2. Frontend (Selenium) - Plus stable, clics simulés")
-        print()
+        if self.mode is None:
+            print("📥 MODE DE TÉLÉCHARGEMENT:")
+            print("   1. Backend (API) - Plus rapide, téléchargements parallèles")
+            print("   2. Frontend (Selenium) - Plus stable, clics simulés")
+            print()
 
-        while True:
-            choice = input("Choix (1/2): ").strip()
-            if choice == '1':
-                self.mode = 'backend'
-                break
-            elif choice == '2':
-                self.mode = 'frontend'
-                break
-            print("❌ Choix invalide")
+            while True:
+                choice = input("Choix (1/2): ").strip()
+                if choice == '1':
+                    self.mode = 'backend'
+                    break
+                elif choice == '2':
+                    self.mode = 'frontend'
+                    break
+                print("❌ Choix invalide")
 
-        print()
+            print()
 
         # Job mode selection
-        print("📋 MODE DE SÉLECTION DES JOBS:")
-        print("   1. Job unique - Vous naviguez vers le job souhaité")
-        print("   2. Tous les jobs - Parcourt automatiquement tous les jobs")
-        print()
+        if self.job_mode is None:
+            print("📋 MODE DE SÉLECTION DES JOBS:")
+            print("   1. Job unique - Vous naviguez vers le job souhaité")
+            print("   2. Tous les jobs - Parcourt automatiquement tous les jobs")
+            print()
 
-        while True:
-            choice = input("Choix (1/2): ").strip()
-            if choice == '1':
-                self.job_mode = 'single'
-                break
-            elif choice == '2':
-                self.job_mode = 'all'
-                break
-            print("❌ Choix invalide")
+            while True:
+                choice = input("Choix (1/2): ").strip()
+                if choice == '1':
+                    self.job_mode = 'single'
+                    break
+                elif choice == '2':
+                    self.job_mode = 'all'
+                    break
+                print("❌ Choix invalide")
 
         # Status filter (only for 'all' mode)
-        if self.job_mode == 'all':
+        if self.job_mode == 'all' and not self.job_statuses:
             print()
             print("📊 STATUT DES ANNONCES À TRAITER:")
             print("   1. Ouvertes uniquement (ACTIVE)")
@@ -173,21 +906,40 @@ class IndeedDownloader:
                 print("❌ Choix invalide")
 
         print()
+        self._print_settings()
+
+    def _apply_batch_settings(self):
+        """Fill in what the menu would ask, for a non-interactive run"""
+        self.mode = self.mode or 'backend'
+        self.job_mode = 'all'
+        if not self.job_statuses:
+            # Given job ids are found whatever their status
+            self.job_statuses = ['ACTIVE', 'PAUSED', 'CLOSED'] if self.job_ids else ['ACTIVE', 'PAUSED']
+        if self.existing_jobs_policy == 'ask':
+            self.existing_jobs_policy = 'new'
+        self.headless = True
+        self._print_settings()
+
+    def _print_settings(self):
+        """Print the chosen mode, jobs and statuses"""
         print("=" * 60)
         print(f"✅ Mode: {self.mode.upper()}")
         print(f"✅ Jobs: {'Unique' if self.job_mode == 'single' else 'Tous'}")
         if self.job_mode == 'all':
             print(f"✅ Statuts: {', '.join(self.job_statuses)}")
+        if self.job_ids:
+            print(f"✅ Job(s): {', '.join(self.job_ids)}")
+        if self.mode == 'backend' and self.sync_mode == 'incremental':
+            print("✅ Synchro: incrementale (nouveaux candidats uniquement)")
         print("=" * 60)
         print()
 
-    def _init_chrome(self):
-        """Initialize Chrome browser with options"""
-        print("🌐 Ouverture de Chrome...")
-
-        chromedriver_autoinstaller.install()
-
+    def _chrome_options(self, headless: bool = False) -> Options:
+        """Chrome options shared by the main browser and the frontend worker browsers"""
         chrome_options = Options()
+        if headless:
+            chrome_options.add_argument('--headless=new')
+            chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--log-level=3')
         chrome_options.add_argument('--silent')
@@ -198,15 +950,53 @@ class IndeedDownloader:
         prefs = {
             "download.default_directory": str(Path(self.download_folder).absolute()),
             "download.prompt_for_download": False,
-            "plugins.always_open_pdf_externally": True
+            "plugins.always_open_pdf_externally": True,
+            "profile.default_content_setting_values.automatic_downloads": 1  # Batched saves trigger many downloads
         }
         chrome_options.add_experimental_option("prefs", prefs)
+        return chrome_options
+
+    def _init_chrome(self):
+        """Initialize Chrome browser with options"""
+        print("🌐 Ouverture de Chrome...")
+
+        chromedriver_autoinstaller.install()
 
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = webdriver.Chrome(options=self._chrome_options(headless=self.headless))
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.driver.maximize_window()
+        if not self.headless:
+            self.driver.maximize_window()
+        self.driver.set_script_timeout(self.script_timeout)  # Batched downloads can take a while
         self.wait = WebDriverWait(self.driver, 30)
 
+    def _wait_until(self, driver, condition, label: str, timeout: float = None):
+        """Wait until condition(driver) is truthy instead of sleeping a fixed time
+
+        Polls every 0.1s within a budget of PAGE_WAIT_TIMEOUT seconds by default. The time
+        actually spent is recorded in the profile as "wait.<label>".
+        Returns the condition's value, or None if the budget ran out.
+        """
+        timeout = self.page_wait_timeout if timeout is None else timeout
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=0.1,
+                                   ignored_exceptions=(WebDriverException,)).until(condition)
+        except TimeoutException:
+            result = None
+        self.profiler.record(f"wait.{label}", time.monotonic() - start, timed_out=result is None)
+        if result is None:
+            self.profiler.count(f"timeout.{label}")
+        return result
+
+    def _page_settled(self, driver) -> bool:
+        """Wait condition: document loaded and no network resource finished for 500ms"""
+        return driver.execute_script("""
+            const count = performance.getEntriesByType('resource').length;
+            const idle = window.__cvIdle || (window.__cvIdle = {count: -1, since: 0});
+            if (count !== idle.count) { idle.count = count; idle.since = Date.now(); }
+            return document.readyState === 'complete' && Date.now() - idle.since >= 500;
+        """)
+
     def _load_saved_cookies(self) -> list:
         """Load cookies from saved JSON file if it exists"""
         cookies_file = Path(self.log_folder) / 'indeed_cookies.json'
@@ -220,10 +1010,11 @@ class IndeedDownloader:
                 pass
         return []
 
-    def _inject_cookies(self, cookies_list: list):
-        """Inject cookies into the browser session"""
-        self.driver.get("https://employers.indeed.com")
-        time.sleep(2)
+    def _inject_cookies(self, cookies_list: list, driver=None):
+        """Inject cookies into the browser session (the main one by default)"""
+        driver = driver or self.driver
+        driver.get("https://employers.indeed.com")
+        self._wait_until(driver, lambda d: d.execute_script("return document.readyState") == 'complete', 'page_load')
 
         injected = 0
         for cookie in cookies_list:
@@ -234,7 +1025,7 @@ class IndeedDownloader:
                     'domain': cookie.get('domain', '.indeed.com'),
                     'path': cookie.get('path', '/')
                 }
-                self.driver.add_cookie(cookie_dict)
+                driver.add_cookie(cookie_dict)
                 self.cookies[cookie['name']] = cookie['value']
 
                 if cookie['name'] == 'CTK':
@@ -243,8 +1034,8 @@ class IndeedDownloader:
             except Exception:
                 continue
 
-        self.driver.refresh()
-        time.sleep(3)
+        driver.refresh()
+        self._wait_until(driver, self._page_settled, 'page_settled')
         return injected
 
     def _is_logged_in(self) -> bool:
@@ -313,7 +1104,7 @@ class IndeedDownloader:
 
         # Navigate to the login page
         self.driver.get("https://employers.indeed.com")
-        time.sleep(2)
+        self._wait_until(self.driver, lambda d: d.execute_script("return document.readyState") == 'complete', 'page_load')
 
         # Wait for login (check every 3 seconds, max 5 minutes)
         max_wait = 300  # 5 minutes
@@ -352,21 +1143,28 @@ class IndeedDownloader:
 
             # Navigate to employer dashboard to check if session is valid
             self.driver.get("https://employers.indeed.com/candidates")
-            time.sleep(4)
+            self._wait_until(self.driver, self._page_settled, 'page_settled')
 
             if self._is_logged_in():
                 print("✅ Connecté avec les cookies sauvegardés")
-                self._capture_api_key()
+                with self.profiler.span('phase.api_key'):
+                    self._capture_api_key()
+                self._init_http_session()
                 return True
             else:
                 print("⚠️  Cookies expirés ou invalides")
 
         # No valid cookies - ask user to log in manually
-        if not self._wait_for_login():
+        if not self.interactive or self.headless:
+            print("❌ Connexion impossible sans fenetre: lancez une fois en mode interactif pour sauvegarder les cookies")
+            return False
+        with self.profiler.span('phase.login'):
+            logged_in = self._wait_for_login()
+        if not logged_in:
             return False
 
-        # Give the page time to fully load after login
-        time.sleep(3)
+        # Let the page finish loading after login
+        self._wait_until(self.driver, self._page_settled, 'page_settled')
 
         # Capture and save cookies from the authenticated session
         cookies = self._capture_browser_cookies()
@@ -376,21 +1174,18 @@ class IndeedDownloader:
             print("   ⚠️  Aucun cookie Indeed capturé")
 
         # Navigate to candidates page and capture API key
-        self._capture_api_key()
+        with self.profiler.span('phase.api_key'):
+            self._capture_api_key()
+        self._init_http_session()
 
         print("✅ Authentification réussie!")
         return True
 
     def _capture_api_key(self):
         """Capture API key from network logs"""
-        try:
-            current_url = self.driver.current_url
-            if 'candidates' not in current_url:
-                self.driver.get("https://employers.indeed.com/candidates")
-                time.sleep(5)
-
-            logs = self.driver.get_log('performance')
-            for log in logs:
+        def find_api_key(driver):
+            # Each call reads the requests logged since the previous one
+            for log in driver.get_log('performance'):
                 try:
                     message = json.loads(log['message'])['message']
                     if message['method'] == 'Network.requestWillBeSent':
@@ -398,16 +1193,62 @@ class IndeedDownloader:
                         if 'graphql' in url and 'apis.indeed.com' in url:
                             headers = message['params']['request']['headers']
                             if 'indeed-api-key' in headers:
-                                self.api_key = headers['indeed-api-key']
-                                break
+                                return headers['indeed-api-key']
                 except (KeyError, json.JSONDecodeError):
                     continue
+            return None
+
+        try:
+            current_url = self.driver.current_url
+            if 'candidates' not in current_url:
+                self.driver.get("https://employers.indeed.com/candidates")
+
+            # The dashboard's first GraphQL call carries the key
+            self.api_key = self._wait_until(self.driver, find_api_key, 'api_key')
 
             if self.api_key:
                 print(f"   ✅ API Key capturée")
         except Exception:
             pass
 
+    def _init_http_session(self):
+        """Build a pooled keep-alive HTTP session from the browser credentials (TRANSPORT=direct)
+
+        Chrome is then only needed for login and the job list: GraphQL calls and
+        PDF downloads go straight to Indeed with the captured cookies, CTK and API key.
+        """
+        if self.engine == 'async':
+            if aiohttp is None or requests is None:
+                print("   ⚠️  Modules 'aiohttp'/'requests' absents, moteur threads utilise")
+                self.engine = 'threads'
+            else:
+                self.transport = 'direct'  # The asyncio engine talks to Indeed over HTTP, not through Chrome
+        if self.transport != 'direct':
+            return
+        if requests is None:
+            print("   ⚠️  Module 'requests' absent, transport navigateur utilise")
+            self.transport = 'browser'
+            return
+
+        # Refresh cookies from the live session (saved ones may have been rotated)
+        browser_cookies = self._capture_browser_cookies()
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.parallel_downloads * 2, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'user-agent': self.driver.execute_script("return navigator.userAgent"),
+            'origin': 'https://employers.indeed.com',
+            'referer': 'https://employers.indeed.com/'
+        })
+        for cookie in browser_cookies:
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain', '.indeed.com'), path=cookie.get('path', '/'))
+
+        self.http = session
+        print(f"   ✅ Transport direct HTTP ({len(browser_cookies)} cookies)")
+
     def _clean_job_title(self, title: str) -> str:
         """Nettoie le titre du job pour créer un nom de dossier valide"""
         # Enlever (H/F), H/F, (F/H), F/H et variantes
@@ -422,38 +1263,38 @@ class IndeedDownloader:
         title = title.strip()
         return title
 
-    def _save_job_stats(self, total_announced: int, total_recovered: int, processed: int):
-        """Save job statistics to stats.json in job folder
+    def _save_job_stats(self, job: JobContext, total_announced: int, total_recovered: int, processed: int):
+        """Save job statistics in the state database
 
         Args:
             total_announced: Number of candidates shown in job listing
             total_recovered: Number of candidates returned by API
             processed: Number of candidates actually processed (CVs + no_cv)
         """
-        if not self.current_job_folder:
+        if not job.folder:
             return
-        stats_file = self.current_job_folder / 'stats.json'
-        stats = {
-            'total_announced': total_announced,
-            'total_recovered': total_recovered,
-            'processed': processed
-        }
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        self.state.upsert_job(job.folder_key, total_announced=total_announced,
+                              total_recovered=total_recovered, processed=processed)
 
-    def _load_job_stats(self, folder: Path) -> dict:
-        """Load job statistics from stats.json"""
-        stats_file = folder / 'stats.json'
-        if stats_file.exists():
-            try:
-                with open(stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return None
+    def _sync_job_folders(self) -> set:
+        """Import job folders unknown to the state database (created by older versions)
 
-    def _create_job_folder(self, job_name: str, job_date: str = None) -> Path:
-        """Create folder for job with name and date"""
+        Returns the names of the job folders present in downloads/.
+        """
+        on_disk = set()
+        download_path = Path(self.download_folder)
+        if not download_path.exists():
+            return on_disk
+        for folder in download_path.iterdir():
+            if folder.is_dir() and not folder.name.startswith('.'):
+                on_disk.add(folder.name)
+                if folder.name not in self.state.known_folders:
+                    self.state.import_folder(folder)
+        return on_disk
+
+    def _create_job_folder(self, job: JobContext, job_date: str = None) -> Path:
+        """Create folder for job with name and date, and attach it to the job context"""
+        job_name = job.name
         # Clean job name for folder
         safe_name = self._clean_job_title(job_name)
         safe_name = safe_name[:80]  # Limit length
@@ -465,16 +1306,22 @@ class IndeedDownloader:
 
         job_folder = Path(self.download_folder) / folder_name
 
-        # Check if folder already exists (has PDFs)
-        self.current_job_is_existing = job_folder.exists() and any(job_folder.glob('*.pdf'))
+        # Folders from older versions are imported into the state database once
+        if job_folder.exists() and folder_name not in self.state.known_folders:
+            self.state.import_folder(job_folder)
+
+        # Check if folder already exists (has CVs)
+        job.is_existing = job_folder.exists() and folder_name in self.state.known_folders
 
         job_folder.mkdir(exist_ok=True)
+        self.state.upsert_job(folder_name, job_id=job.job_id, title=job_name, job_date=job_date)
 
-        self.current_job_folder = job_folder
+        job.folder = job_folder
         return job_folder
 
-    def _close_modals(self):
-        """Close any modal/popup that might be open"""
+    def _close_modals(self, driver=None):
+        """Close any modal/popup that might be open (in the main browser by default)"""
+        driver = driver or self.driver
         try:
             # Common modal close selectors
             close_selectors = [
@@ -492,22 +1339,29 @@ class IndeedDownloader:
                 "div[role='dialog'] button[type='button']",
             ]
 
+            def closed(btn):
+                def check(driver):
+                    try:
+                        return not btn.is_displayed()
+                    except StaleElementReferenceException:
+                        return True  # Removed from the page
+                return check
+
             for selector in close_selectors:
                 try:
-                    buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    buttons = driver.find_elements(By.CSS_SELECTOR, selector)
                     for btn in buttons:
                         if btn.is_displayed():
                             btn.click()
-                            time.sleep(0.3)
+                            self._wait_until(driver, closed(btn), 'modal_close', timeout=2)
                 except (NoSuchElementException, StaleElementReferenceException):
                     continue
 
             # Also try pressing Escape key
             try:
                 from selenium.webdriver.common.keys import Keys
-                body = self.driver.find_element(By.TAG_NAME, "body")
+                body = driver.find_element(By.TAG_NAME, "body")
                 body.send_keys(Keys.ESCAPE)
-                time.sleep(0.3)
             except (NoSuchElementException, Exception):
                 pass
 
@@ -527,30 +1381,16 @@ class IndeedDownloader:
 
     # ==================== BACKEND MODE (API) ====================
 
-    def fetch_candidates_api(self, offset: int = 0, limit: int = 100, dispositions: list = None, sort_by: str = "APPLY_DATE", sort_order: str = "DESCENDING"):
-        """Fetch candidates using GraphQL API via browser"""
-        query = """query FindRCPMatches($input: OrchestrationMatchesInput!) {
-  findRCPMatches(input: $input) {
-    overallMatchCount
-    matchConnection {
-      pageInfo { hasNextPage }
-      matches {
-        candidateSubmission {
-          id
-          data {
-            profile { name { displayName } }
-            resume {
-              ... on CandidatePdfResume { id, downloadUrl }
-            }
-            ... on IndeedApplyCandidateSubmission { legacyID }
-            ... on EmployerGeneratedCandidateSubmission { legacyID }
-          }
-        }
-      }
-    }
-  }
-}"""
+    def fetch_candidates_api(self, job: JobContext, offset: int = 0, limit: int = 100, dispositions: list = None,
+                             sort_by: str = "APPLY_DATE", sort_order: str = "DESCENDING", selection: str = 'full',
+                             quiet: bool = False):
+        """Fetch candidates using GraphQL API, returns (matches, overallMatchCount) or (None, 0) on failure
 
+        Args:
+            selection: 'full' (name, resume, legacy id), 'ids' (legacy ids only) or 'count' (no matches)
+            quiet: Do not print API errors (expected failures, e.g. page size probes)
+        """
+        query = FIND_MATCHES_QUERIES[selection]
         if dispositions is None:
             dispositions = ["NEW", "PENDING", "PHONE_SCREENED", "INTERVIEWED", "OFFER_MADE", "REVIEWED"]
 
@@ -571,101 +1411,803 @@ class IndeedDownloader:
             }
         }
 
-        if self.current_job_id:
+        if job.job_id:
             variables["input"]["identifiers"] = {
-                "jobIdentifiers": {"employerJobId": self.current_job_id}
+                "jobIdentifiers": {"employerJobId": job.job_id}
             }
 
         payload = {"operationName": "FindRCPMatches", "variables": variables, "query": query}
 
+        result, status, error = self._request_with_retries(
+            lambda: self._graphql_request(payload),
+            lock=None if self.http else self._driver_lock
+        )
+        if not result or 'errors' in result:
+            if not quiet:
+                reason = error or (result['errors'][0].get('message') if result else f"HTTP {status}")
+                print(f"❌ Erreur API (offset {offset}): {reason}")
+            return None, 0
+
+        matches = result.get('data', {}).get('findRCPMatches', {}).get('matchConnection', {}).get('matches', [])
+        total = result.get('data', {}).get('findRCPMatches', {}).get('overallMatchCount', 0)
+        return matches, total
+
+    def _graphql_request(self, payload: dict) -> tuple:
+        """POST a GraphQL payload to Indeed, as a persisted query (hash only) while the server accepts them
+
+        Returns (json_body, http_status); the body is None when the status is not 2xx.
+        """
+        if self.persisted_queries == 'off' or 'query' not in payload:
+            return self._post_graphql(payload)
+
+        digest = hashlib.sha256(payload['query'].encode()).hexdigest()
+        extensions = {'persistedQuery': {'version': 1, 'sha256Hash': digest}}
+        hashed = {k: v for k, v in payload.items() if k != 'query'}
+        hashed['extensions'] = extensions
+        body, status = self._post_graphql(hashed)
+        if status is not None and status < 400 and body and not body.get('errors'):
+            return body, status
+
+        messages = ' '.join(str(e.get('message', '')) + str(e.get('extensions', {}).get('code', ''))
+                            for e in (body or {}).get('errors', []))
+        if 'PersistedQueryNotFound' in messages or 'PERSISTED_QUERY_NOT_FOUND' in messages:
+            if digest not in self._persisted_hashes:
+                self._persisted_hashes.add(digest)
+                return self._post_graphql({**payload, 'extensions': extensions})  # Registers the hash
+            self.persisted_queries = 'off'  # Registered but still unknown: the server does not keep them
+            return self._post_graphql(payload)
+        if status is None or status in TRANSIENT_STATUSES:
+            return body, status  # Retried by the caller
+
+        # Any other error: the full query tells whether the hash or the request itself is the problem
+        full_body, full_status = self._post_graphql(payload)
+        not_supported = 'PersistedQueryNotSupported' in messages or 'PERSISTED_QUERY_NOT_SUPPORTED' in messages
+        if not_supported or (full_status is not None and full_status < 400
+                             and full_body and not full_body.get('errors')):
+            self.persisted_queries = 'off'
+        return full_body, full_status
+
+    def _post_graphql(self, payload: dict) -> tuple:
+        """POST a GraphQL payload to Indeed, through the browser or the direct HTTP session
+
+        Returns (json_body, http_status); the body is None when the status is not 2xx.
+        """
+        headers = dict(GRAPHQL_HEADERS)
+        headers["indeed-api-key"] = self.api_key
+        headers["indeed-ctk"] = self.ctk
+        self._inc_stat('api_calls')
+
+        if self.http:
+            response = self.http.post(GRAPHQL_URL, json=payload, headers=headers, timeout=self.http_timeout)
+            return (response.json() if response.ok else None), response.status_code
+
         js_code = f"""
-        return await fetch("https://apis.indeed.com/graphql?co=FR&locale=fr-FR", {{
+        return await fetch("{GRAPHQL_URL}", {{
             method: "POST",
-            headers: {{
-                "accept": "*/*",
-                "content-type": "application/json",
-                "indeed-api-key": "{self.api_key}",
-                "indeed-ctk": "{self.ctk}",
-                "indeed-client-sub-app": "talent-organization-modules",
-                "indeed-client-sub-app-component": "./CandidateListPage"
-            }},
+            headers: {json.dumps(headers)},
             body: JSON.stringify({json.dumps(payload)}),
             credentials: "include"
-        }}).then(r => r.json());
+        }}).then(async r => ({{ status: r.status, body: r.ok ? await r.json() : null }}));
         """
+        with self._driver_lock:
+            response = self.driver.execute_script(js_code) or {}
+        return response.get('body'), response.get('status')
 
-        try:
-            result = self.driver.execute_script(js_code)
-            if not result or 'errors' in result:
-                return [], 0
+    def _record_request(self, kind: str, latency: float, statuses: list, **fields):
+        """Report one call to Indeed (a browser batch has one status per CV) to the profile and the metrics"""
+        self.profiler.record(f"http.{kind}", latency, status=statuses[0] if len(statuses) == 1 else None, **fields)
+        self.request_latency.observe(kind, latency)
+        for status in statuses:
+            self.profiler.count(f"status.{status}")
 
-            matches = result.get('data', {}).get('findRCPMatches', {}).get('matchConnection', {}).get('matches', [])
-            total = result.get('data', {}).get('findRCPMatches', {}).get('overallMatchCount', 0)
-            return matches, total
-        except Exception as e:
-            print(f"❌ Erreur API: {e}")
-            return [], 0
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter before retry number `attempt` (1-based)"""
+        return random.uniform(0, min(60.0, self.retry_backoff * 2 ** attempt))
+
+    def _request_with_retries(self, request, cost: int = 1, lock=None, kind: str = 'graphql') -> tuple:
+        """Run one Indeed call through the shared limiter, retrying 429/5xx/network errors with backoff
+
+        Returns (result, http_status, error) of the last attempt.
+        """
+        result, status, error = None, None, None
+        for attempt in range(self.max_retries + 1):
+            if self._cancel.is_set():
+                return None, None, 'interrompu'
+            if attempt:
+                self._inc_stat('retries')
+                with self.profiler.span('sleep.retry_backoff'):
+                    time.sleep(self._retry_delay(attempt))
+            result, status, error = None, None, None
+            with lock or nullcontext():  # Before the limiter: waiting for the browser is not a slow response
+                with self.profiler.span('wait.limiter'):
+                    self.limiter.acquire(cost)
+                started = time.monotonic()
+                try:
+                    result, status = request()
+                except Exception as e:
+                    error = str(e)
+                finally:
+                    latency = time.monotonic() - started
+                    self.limiter.release(status, latency)
+                    self._record_request(kind, latency, [status], attempt=attempt)
+            if status is not None and status not in TRANSIENT_STATUSES:
+                break
+        return result, status, error
 
-    def download_cv_api(self, candidate: dict) -> bool:
-        """Download CV via API"""
-        name = candidate['name']
+    def _fetch_cv_direct(self, candidate: dict):
+        """Open a streamed CV response over the direct HTTP session, with the catws fallback
+
+        Returns (response, error): the response (body not read yet), or None and
+        the last error if every URL failed.
+        """
+        def get(url: str) -> tuple:
+            response = self.http.get(url, timeout=self.http_timeout, stream=True)
+            if response.ok:
+                return response, response.status_code
+            response.close()
+            return None, response.status_code
+
+        urls = [candidate['download_url']] if candidate.get('download_url') else []
+        urls.append(RESUME_FALLBACK_URL.format(legacy_id=candidate['legacy_id']))
+        error = None
+        for url in urls:
+            response, status, error = self._request_with_retries(lambda: get(url), kind='cv')
+            if response is not None:
+                return response, None
+            error = error or f"HTTP {status}"
+        return None, error
+
+    def download_cv_api(self, job: JobContext, candidate: dict) -> bool:
+        """Download CV via API (safe to call from several worker threads)"""
         legacy_id = candidate['legacy_id']
-        download_url = candidate['download_url']
 
-        if legacy_id in self.checkpoint_data['downloaded_ids']:
-            self.stats['skipped'] += 1
+        if legacy_id in self.state.downloaded_ids:
+            self._inc_stat('skipped')
+            return True
+
+        if self._reuse_stored_cv(job, candidate):
             return True
 
+        if not self.http:
+            return self.download_cvs_batch_api(job, [candidate])[0]['ok']
+
         try:
+            response, error = self._fetch_cv_direct(candidate)
+            if response is None:
+                self._inc_stat('failed')
+                self._record_download_failure(job, candidate, error)
+                return False
+            with response:
+                ok = self._store_cv_stream(job, candidate, response)
+            if not ok:
+                self._record_download_failure(job, candidate, 'file too small')
+            return ok
+
+        except Exception as e:
+            self._inc_stat('failed')
+            self._record_download_failure(job, candidate, str(e))
+            return False
+
+    def _enable_staged_downloads(self):
+        """Make Chrome save downloads into the staging folder (PDF_TRANSFER=save)"""
+        if self._staging_enabled:
+            return
+        with self._driver_lock:
+            if self._staging_enabled:
+                return
+            self.staging_folder.mkdir(parents=True, exist_ok=True)
+            self.driver.execute_cdp_cmd('Browser.setDownloadBehavior', {
+                'behavior': 'allow',
+                'downloadPath': str(self.staging_folder.absolute())
+            })
+            self._staging_enabled = True
+
+    def _wait_for_staged_file(self, path: Path) -> bool:
+        """Wait for Chrome to finish writing a staged download
+
+        Chrome writes into "<name>.crdownload" and renames it when done, so a single
+        stat on the final path is enough (no folder scan).
+        """
+        with self.profiler.span('wait.staged_file'):
+            deadline = time.time() + self.download_verify_timeout
+            while time.time() < deadline:
+                if path.exists():
+                    return True
+                time.sleep(0.1)
+            return False
+
+    def download_cvs_batch_api(self, job: JobContext, candidates: list) -> list:
+        """Download several CVs in a single browser round-trip (Promise.all in the page)
+
+        Returns one {'legacy_id', 'ok', 'fallback', 'status', 'error'} dict per candidate, in input order
+        """
+        results = []
+        to_fetch = []
+        for candidate in candidates:
+            if candidate['legacy_id'] in self.state.downloaded_ids:
+                self._inc_stat('skipped')
+                results.append({'legacy_id': candidate['legacy_id'], 'ok': True, 'fallback': False,
+                                'status': None, 'error': 'already downloaded'})
+            elif self._reuse_stored_cv(job, candidate):
+                results.append({'legacy_id': candidate['legacy_id'], 'ok': True, 'fallback': False,
+                                'status': None, 'error': None})
+            else:
+                to_fetch.append(candidate)
+                results.append(None)
+
+        if not to_fetch:
+            return results
+
+        save_to_disk = self.pdf_transfer == 'save'
+        if save_to_disk:
+            self._enable_staged_downloads()
+            for c in to_fetch:
+                self._staged_path(c).unlink(missing_ok=True)  # Chrome would pick "id (1).pdf" otherwise
+
+        fetched_by_id = {}
+        pending = to_fetch
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._inc_stat('retries', len(pending))
+                time.sleep(self._retry_delay(attempt))
+            items = [{'legacy_id': c['legacy_id'], 'download_url': c['download_url'],
+                      'filename': self._staged_path(c).name} for c in pending]
+            limit = max(1, min(self.batch_concurrency, int(self.limiter.concurrency)))
             js_code = f"""
-            const response = await fetch("{download_url}", {{ credentials: "include" }});
-            if (!response.ok) {{
-                const altResponse = await fetch("https://employers.indeed.com/api/catws/resume/v2/download?id={legacy_id}", {{ credentials: "include" }});
-                if (!altResponse.ok) return null;
-                const blob = await altResponse.blob();
-                return await new Promise((resolve) => {{
-                    const reader = new FileReader();
-                    reader.onloadend = () => resolve(reader.result.split(',')[1]);
-                    reader.readAsDataURL(blob);
-                }});
-            }}
-            const blob = await response.blob();
-            return await new Promise((resolve) => {{
+            const items = {json.dumps(items)};
+            const limit = {limit};
+            const saveToDisk = {'true' if save_to_disk else 'false'};
+            const toBase64 = (blob) => new Promise((resolve) => {{
                 const reader = new FileReader();
                 reader.onloadend = () => resolve(reader.result.split(',')[1]);
                 reader.readAsDataURL(blob);
             }});
+            const saveBlob = (blob, filename) => {{
+                const url = URL.createObjectURL(blob);
+                const a = document.createElement('a');
+                a.href = url;
+                a.download = filename;
+                document.body.appendChild(a);
+                a.click();
+                a.remove();
+                setTimeout(() => URL.revokeObjectURL(url), 60000);
+            }};
+            const fetchOne = async (item) => {{
+                try {{
+                    let fallback = false;
+                    let response = item.download_url ? await fetch(item.download_url, {{ credentials: "include" }}) : null;
+                    if (!response || !response.ok) {{
+                        fallback = true;
+                        response = await fetch("{RESUME_FALLBACK_URL.format(legacy_id='')}" + encodeURIComponent(item.legacy_id), {{ credentials: "include" }});
+                        if (!response.ok) return {{ legacy_id: item.legacy_id, data: null, saved: false, fallback, status: response.status }};
+                    }}
+                    const blob = await response.blob();
+                    if (saveToDisk) {{
+                        saveBlob(blob, item.filename);
+                        return {{ legacy_id: item.legacy_id, data: null, saved: true, fallback, status: response.status }};
+                    }}
+                    return {{ legacy_id: item.legacy_id, data: await toBase64(blob), saved: false, fallback, status: response.status }};
+                }} catch (e) {{
+                    return {{ legacy_id: item.legacy_id, data: null, saved: false, fallback: false, status: null, error: String(e) }};
+                }}
+            }};
+            const results = new Array(items.length);
+            let next = 0;
+            const worker = async () => {{
+                while (next < items.length) {{
+                    const i = next++;
+                    results[i] = await fetchOne(items[i]);
+                }}
+            }};
+            await Promise.all(Array.from({{ length: Math.min(limit, items.length) }}, worker));
+            return results;
             """
 
-            base64_data = self.driver.execute_script(js_code)
-            if not base64_data:
-                self.stats['failed'] += 1
-                return False
+            fetched = []
+            batch_error = 'missing result'
+            with self._driver_lock:
+                with self.profiler.span('wait.limiter'):
+                    self.limiter.acquire(len(pending))
+                started = time.monotonic()
+                try:
+                    fetched = self.driver.execute_script(js_code) or []
+                except Exception as e:
+                    batch_error = str(e)
+                statuses = [item.get('status') if item else None for item in fetched]
+                statuses += [None] * (len(pending) - len(statuses))
+                transient = [st for st in statuses if st is None or st in TRANSIENT_STATUSES]
+                # Latency judged per request: the page runs `limit` fetches at a time
+                rounds = -(-len(pending) // limit)
+                self.limiter.release(429 if 429 in transient else (transient[0] if transient else 200),
+                                     (time.monotonic() - started) / rounds)
+                self._record_request('cv_batch', time.monotonic() - started, statuses, cvs=len(pending))
+
+            for c, item in zip(pending, fetched):
+                fetched_by_id[c['legacy_id']] = item
+            pending = [c for c, st in zip(pending, statuses) if st is None or st in TRANSIENT_STATUSES]
+            if not pending:
+                break
 
-            pdf_data = base64.b64decode(base64_data)
+        for i, result in enumerate(results):
+            if result is not None:
+                continue
+            candidate = candidates[i]
+            item = fetched_by_id.get(candidate['legacy_id']) or {}
+            ok = False
+            error = item.get('error') or (None if item else batch_error)
+            try:
+                if item.get('saved'):
+                    staged = self._staged_path(candidate)
+                    if self._wait_for_staged_file(staged):
+                        ok = self._store_cv_staged(job, candidate, staged)
+                        error = None if ok else 'file too small'
+                    else:
+                        self._inc_stat('failed')
+                        error = 'download timeout'
+                elif item.get('data'):
+                    ok = self._store_cv(job, candidate, base64.b64decode(item['data']))
+                    error = None if ok else 'file too small'
+                else:
+                    self._inc_stat('failed')
+                    error = error or f"HTTP {item.get('status')}"
+            except Exception as e:
+                self._inc_stat('failed')
+                error = str(e)
+            if not ok:
+                self._record_download_failure(job, candidate, error)
+            results[i] = {
+                'legacy_id': candidate['legacy_id'],
+                'ok': ok,
+                'fallback': bool(item.get('fallback')),
+                'status': item.get('status'),
+                'error': None if ok else error
+            }
 
-            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{safe_name}_{timestamp}.pdf"
+        return results
 
-            folder = self.current_job_folder or Path(self.download_folder)
-            filepath = folder / filename
+    def _staged_path(self, candidate: dict) -> Path:
+        """Path where Chrome saves a candidate's CV before it is moved to the job folder"""
+        return self.staging_folder / f"{candidate['legacy_id']}.pdf"
 
-            with open(filepath, 'wb') as f:
-                f.write(pdf_data)
+    def _reserve_cv_path(self, folder: Path, name: str) -> Path:
+        """Create a new empty file "Name_YYYYmmdd_HHMMSS.pdf", never reusing an existing one
 
-            if filepath.stat().st_size > 1000:
-                self._save_checkpoint(name=name, legacy_id=legacy_id)
-                self.stats['downloaded'] += 1
-                return True
+        Files are created with exclusive mode so two workers downloading
+        candidates with the same name in the same second get distinct files.
+        """
+        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        suffix = 1
+        filepath = folder / f"{safe_name}_{timestamp}.pdf"
+        while True:
+            try:
+                open(filepath, 'xb').close()
+                return filepath
+            except FileExistsError:
+                suffix += 1
+                filepath = folder / f"{safe_name}_{timestamp}-{suffix}.pdf"
+
+    def _finalize_cv(self, job: JobContext, candidate: dict, filepath: Path) -> bool:
+        """Validate a written CV file and update checkpoint/stats
+
+        With CV_STORE enabled the file is moved into the CV store and replaced by a link.
+        """
+        size = filepath.stat().st_size
+        if size > 1000:
+            sha256 = None
+            if self.cv_store != 'off':
+                with self.profiler.span('file.store'):
+                    sha256 = self._add_to_store(filepath)
+            self._save_checkpoint(job, name=candidate['name'], legacy_id=candidate['legacy_id'],
+                                  resume_id=candidate.get('resume_id'), file_path=filepath, sha256=sha256)
+            self._inc_stat('downloaded')
+            self._inc_stat('bytes_written', size)
+            return True
+
+        filepath.unlink()
+        self._inc_stat('failed')
+        return False
+
+    def _blob_path(self, sha256: str) -> Path:
+        """Location of a CV in the content-addressed store (downloads/.store/ab/abcd....pdf)"""
+        return self.store_folder / sha256[:2] / f"{sha256}.pdf"
+
+    def _add_to_store(self, filepath: Path) -> str:
+        """Move a CV into the store under its SHA-256 and link it back into the job folder
+
+        Identical PDFs (same applicant in several jobs) are stored once. Returns the hash.
+        """
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        blob = self._blob_path(sha256)
+        with self._store_lock:
+            if blob.exists():
+                self._inc_stat('deduplicated')
             else:
-                filepath.unlink()
-                self.stats['failed'] += 1
-                return False
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(filepath, blob)
+            self._link_cv(blob, filepath)
+        return sha256
+
+    def _link_cv(self, blob: Path, filepath: Path):
+        """Make `filepath` point at a stored CV (CV_STORE=hardlink/symlink, copy if links are unsupported)"""
+        filepath.unlink(missing_ok=True)
+        try:
+            if self.cv_store == 'symlink':
+                filepath.symlink_to(os.path.relpath(blob, filepath.parent))
+            else:
+                os.link(blob, filepath)
+        except OSError:
+            shutil.copy2(blob, filepath)
 
-        except Exception as e:
-            self.stats['failed'] += 1
+    def _reuse_stored_cv(self, job: JobContext, candidate: dict) -> bool:
+        """Link a CV whose resume id is already in the store instead of downloading it again"""
+        if self.cv_store == 'off':
+            return False
+        sha256 = self.state.resume_blobs.get(candidate.get('resume_id'))
+        if not sha256:
             return False
+        blob = self._blob_path(sha256)
+        if not blob.exists():
+            return False
+
+        filepath = self._reserve_cv_path(self._job_folder_or_default(job), candidate['name'])
+        with self._store_lock:
+            self._link_cv(blob, filepath)
+        self._save_checkpoint(job, name=candidate['name'], legacy_id=candidate['legacy_id'],
+                              resume_id=candidate.get('resume_id'), file_path=filepath, sha256=sha256)
+        self._inc_stat('reused')
+        return True
+
+    def _job_folder_or_default(self, job: JobContext) -> Path:
+        """Folder where CVs of a job are written"""
+        return job.folder or Path(self.download_folder)
+
+    def _store_cv(self, job: JobContext, candidate: dict, pdf_data: bytes) -> bool:
+        """Write downloaded PDF bytes to the job folder (PDF_TRANSFER=inline)"""
+        filepath = self._reserve_cv_path(self._job_folder_or_default(job), candidate['name'])
+        with self.profiler.span('file.write'), open(filepath, 'wb') as f:
+            f.write(pdf_data)
+        return self._finalize_cv(job, candidate, filepath)
+
+    def _store_cv_stream(self, job: JobContext, candidate: dict, response) -> bool:
+        """Stream an HTTP response body to the job folder in fixed-size chunks"""
+        filepath = self._reserve_cv_path(self._job_folder_or_default(job), candidate['name'])
+        try:
+            with self.profiler.span('file.write'), open(filepath, 'wb') as f:  # Includes reading the body
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+        except Exception:
+            filepath.unlink(missing_ok=True)
+            raise
+        return self._finalize_cv(job, candidate, filepath)
+
+    def _store_cv_staged(self, job: JobContext, candidate: dict, staged: Path) -> bool:
+        """Move a CV saved by Chrome from the staging folder to the job folder"""
+        filepath = self._reserve_cv_path(self._job_folder_or_default(job), candidate['name'])
+        with self.profiler.span('file.move'):
+            shutil.move(str(staged), str(filepath))
+        return self._finalize_cv(job, candidate, filepath)
+
+    def _download_candidates_parallel(self, job: JobContext, candidates: list) -> int:
+        """Download a known list of CVs with the worker pool, returns number of CVs downloaded"""
+        source = queue.Queue()
+        for candidate in candidates:
+            source.put(candidate)
+        source.put(None)
+        return self._run_download_engine(job, source, total=len(candidates))
+
+    def _run_download_engine(self, job: JobContext, source: queue.Queue, total: int = None) -> int:
+        """Drain a candidate queue with the configured engine (ENGINE=threads or async)"""
+        with self.profiler.span('phase.downloads', job=job.job_id, engine=self.engine):
+            if self.engine == 'async':
+                return asyncio.run(self._download_from_queue_async(job, source, total))
+            return self._download_from_queue(job, source, total)
+
+    def _download_from_queue(self, job: JobContext, source: queue.Queue, total: int = None) -> int:
+        """Download CVs from a queue on the shared download workers until a None sentinel
+
+        Returns number of CVs downloaded.
+        """
+        downloaded_count = 0
+        failed_count = 0
+        # Batching only saves browser round-trips, direct HTTP fetches one CV per request
+        batch_size = self.download_batch_size if not self.http else 1
+        exhausted = False
+        in_flight = {}  # future -> number of candidates in the unit
+
+        def run_unit(unit: list) -> int:
+            if len(unit) == 1:
+                return 1 if self.download_cv_api(job, unit[0]) else 0
+            return sum(1 for r in self.download_cvs_batch_api(job, unit) if r['ok'])
+
+        def take_unit(block: bool) -> list:
+            nonlocal exhausted
+            unit = []
+            try:
+                item = source.get(timeout=0.2) if block else source.get_nowait()
+                while item is not None:
+                    unit.append(item)
+                    if len(unit) >= batch_size:
+                        break
+                    item = source.get_nowait()
+                if item is None:
+                    exhausted = True
+            except queue.Empty:
+                pass
+            return unit
+
+        executor = self.download_executor
+        max_units = max(self.parallel_downloads, self.max_in_flight // batch_size)
+        with tqdm(total=total, desc="   CVs", disable=self._jobs_running_concurrently) as pbar:
+            try:
+                while not self._cancel.is_set():
+                    while not exhausted and len(in_flight) < max_units:
+                        unit = take_unit(block=not in_flight)
+                        if not unit:
+                            break
+                        in_flight[executor.submit(run_unit, unit)] = len(unit)
+
+                    if not in_flight:
+                        if exhausted:
+                            break
+                        continue
+
+                    done, _ = wait(in_flight, timeout=None if exhausted else 0.2, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        unit_size = in_flight.pop(future)
+                        ok = future.result()
+                        downloaded_count += ok
+                        failed_count += unit_size - ok
+                        pbar.update(unit_size)
+                    pbar.set_postfix(ok=downloaded_count, echecs=failed_count, en_cours=sum(in_flight.values()))
+            except KeyboardInterrupt:
+                # Drop queued downloads, let the running ones finish writing their file
+                for future in in_flight:
+                    future.cancel()
+                raise
+            # Interrupted from another thread: same, without raising here
+            for future in in_flight:
+                future.cancel()
+
+        return downloaded_count
+
+    async def _download_from_queue_async(self, job: JobContext, source: queue.Queue, total: int = None) -> int:
+        """Asyncio engine (ENGINE=async): same contract as _download_from_queue, on a single thread
+
+        Returns number of CVs downloaded.
+        """
+        counts = {'ok': 0, 'failed': 0}
+        tasks = set()
+        slots = asyncio.Semaphore(self.async_concurrency)
+        main_task = asyncio.current_task()
+
+        async def watch_cancel():
+            while not self._cancel.is_set():
+                await asyncio.sleep(0.2)
+            main_task.cancel()
+
+        async def download(candidate: dict) -> bool:
+            try:
+                return await self._download_cv_async(session, job, candidate)
+            except Exception as e:  # Like download_cv_api: counted, then retried at the end of the job
+                self._inc_stat('failed')
+                await self._in_thread(self._record_download_failure, job, candidate, str(e))
+                return False
+
+        def on_done(task: asyncio.Task):
+            tasks.discard(task)
+            slots.release()
+            if not task.cancelled():
+                counts['ok' if not task.exception() and task.result() else 'failed'] += 1
+                pbar.update(1)
+                pbar.set_postfix(ok=counts['ok'], echecs=counts['failed'], en_cours=len(tasks))
+
+        watcher = asyncio.ensure_future(watch_cancel())
+        session = aiohttp.ClientSession(
+            headers=dict(self.http.headers),
+            cookie_jar=self._aiohttp_cookie_jar(),
+            timeout=aiohttp.ClientTimeout(total=self.http_timeout),
+            connector=aiohttp.TCPConnector(limit=self.async_concurrency)
+        )
+        pbar = tqdm(total=total, desc="   CVs", disable=self._jobs_running_concurrently)
+        try:
+            while True:
+                try:
+                    candidate = source.get_nowait()
+                except queue.Empty:
+                    await asyncio.sleep(0.05)
+                    continue
+                if candidate is None:
+                    break
+                await slots.acquire()
+                task = asyncio.ensure_future(download(candidate))
+                tasks.add(task)
+                task.add_done_callback(on_done)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            print(f"\n   Interrompu: {counts['ok']} CVs telecharges, checkpoint sauvegarde")
+        finally:
+            watcher.cancel()
+            pbar.close()
+            await session.close()
+            self.state.flush()
+
+        return counts['ok']
+
+    def _aiohttp_cookie_jar(self):
+        """Copy the direct HTTP session's cookies into an aiohttp jar, each kept to its own domain and path"""
+        jar = aiohttp.CookieJar()
+        for cookie in self.http.cookies:
+            host = (cookie.domain or '').lstrip('.')
+            if not host:
+                continue
+            morsel = Morsel()
+            morsel.set(cookie.name, cookie.value, cookie.value)  # Sent as is, like requests does
+            morsel['path'] = cookie.path or '/'
+            if cookie.domain.startswith('.'):
+                morsel['domain'] = cookie.domain  # Domain cookie, else host-only for `host`
+            if cookie.secure:
+                morsel['secure'] = True
+            jar.update_cookies({cookie.name: morsel}, response_url=URL(f"https://{host}/"))
+        return jar
+
+    async def _download_cv_async(self, session, job: JobContext, candidate: dict) -> bool:
+        """Download one CV with aiohttp (ENGINE=async), with the catws fallback and jittered retries"""
+        if candidate['legacy_id'] in self.state.downloaded_ids:
+            self._inc_stat('skipped')
+            return True
+        if await self._in_thread(self._reuse_stored_cv, job, candidate):
+            return True
+
+        urls = [candidate['download_url']] if candidate.get('download_url') else []
+        urls.append(RESUME_FALLBACK_URL.format(legacy_id=candidate['legacy_id']))
+        error = None
+        for url in urls:
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self._inc_stat('retries')
+                    with self.profiler.span('sleep.retry_backoff'):
+                        await asyncio.sleep(self._retry_delay(attempt))
+                waited = time.perf_counter()
+                while True:
+                    wait_time = self.limiter.try_acquire()
+                    if not wait_time:
+                        break
+                    await asyncio.sleep(wait_time)
+                self.profiler.record('wait.limiter', time.perf_counter() - waited)
+
+                status = None
+                started = time.monotonic()
+                try:
+                    async with session.get(url) as response:
+                        status = response.status
+                        if status == 200:
+                            filepath = await self._in_thread(
+                                self._reserve_cv_path, self._job_folder_or_default(job), candidate['name'])
+                            try:
+                                with self.profiler.span('file.write'):
+                                    f = await self._in_thread(open, filepath, 'wb')
+                                    try:
+                                        async for chunk in response.content.iter_chunked(64 * 1024):
+                                            await self._in_thread(f.write, chunk)
+                                    finally:
+                                        f.close()
+                            except BaseException:
+                                filepath.unlink(missing_ok=True)  # Never leave a partial PDF behind
+                                raise
+                            ok = await self._in_thread(self._finalize_cv, job, candidate, filepath)
+                            if not ok:
+                                await self._in_thread(self._record_download_failure, job, candidate, 'file too small')
+                            return ok
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    error = str(e)
+                finally:
+                    latency = time.monotonic() - started
+                    self.limiter.release(status, latency)
+                    self._record_request('cv', latency, [status], attempt=attempt)
+
+                if status is not None and status not in TRANSIENT_STATUSES:
+                    break
+            error = error if status is None else f"HTTP {status}"
+
+        self._inc_stat('failed')
+        await self._in_thread(self._record_download_failure, job, candidate, error)
+        return False
+
+    @staticmethod
+    async def _in_thread(func, *args):
+        """Run blocking disk or SQLite work off the event loop (like asyncio.to_thread, which needs Python 3.9)"""
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+    def _record_download_failure(self, job: JobContext, candidate: dict, error: str):
+        """Queue a failed CV in the state database for the end-of-job retry"""
+        self.state.record_failure(job.folder_key, candidate, error or 'unknown error')
+        with self._stats_lock:
+            self._failed_this_run.add(candidate['legacy_id'])
+
+    def _retry_failed_downloads(self, job: JobContext) -> int:
+        """Retry the job's queued failed CVs in rounds with growing backoff, then dead-letter the rest
+
+        Returns number of CVs recovered.
+        """
+        recovered = 0
+        for round_num in range(1, self.download_retry_rounds + 1):
+            failed = self.state.failed_candidates(job.folder_key)
+            if not failed or self._cancel.is_set():
+                break
+            delay = self.download_retry_delay * 2 ** (round_num - 1) * random.uniform(0.5, 1.5)
+            print(f"   Reessai de {len(failed)} CV(s) en echec dans {delay:.0f}s "
+                  f"(tour {round_num}/{self.download_retry_rounds})...")
+            with self.profiler.span('sleep.retry_round'):
+                time.sleep(delay)
+            # Failures of this run are counted again only if they fail again (older ones were never counted)
+            with self._stats_lock:
+                retried = self._failed_this_run.intersection(c['legacy_id'] for c in failed)
+                self._failed_this_run -= retried
+            self._inc_stat('failed', -len(retried))
+            recovered += self._download_candidates_parallel(job, failed)
+
+        dead = self.state.failed_candidates(job.folder_key)
+        if dead and not self._cancel.is_set():
+            self.state.set_failed_status(job.folder_key, [c['legacy_id'] for c in dead], 'dead')
+            self._write_dead_letter()
+            print(f"   ⚠️  {len(dead)} CV(s) abandonnes, voir {self.dead_letter_file} (--retry-failed pour reessayer)")
+        return recovered
+
+    def _write_dead_letter(self):
+        """Rewrite the dead-letter file (one JSON line per abandoned CV) from the state database"""
+        dead = self.state.failed_candidates(statuses=('dead',))
+        with self._dead_letter_lock:
+            if not dead:
+                self.dead_letter_file.unlink(missing_ok=True)
+                return
+            tmp_file = self.dead_letter_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for row in dead:
+                    f.write(json.dumps(row, ensure_ascii=False) + '\n')
+            tmp_file.replace(self.dead_letter_file)
+
+    def run_retry_failed(self):
+        """Re-download only the failed and dead-lettered CVs, without listing candidates again"""
+        failed = self.state.failed_candidates(statuses=('failed', 'dead'))
+        if not failed:
+            print("\n✅ Aucun CV en echec a reessayer")
+            return
+
+        by_folder = {}
+        for c in failed:
+            by_folder.setdefault(c['folder'], []).append(c)
+        print(f"\n🔁 {len(failed)} CV(s) en echec dans {len(by_folder)} job(s)")
+
+        summaries = self.state.job_summaries()
+        for folder_key, candidates in by_folder.items():
+            info = summaries.get(folder_key, {})
+            job = JobContext(job_id=info.get('job_id'), name=info.get('title') or folder_key or 'Sans job',
+                             folder=Path(self.download_folder) / folder_key if folder_key else None)
+            if job.folder:
+                job.folder.mkdir(parents=True, exist_ok=True)
+                job.is_existing = True
+
+            print(f"\n📁 {job.name}: {len(candidates)} CV(s)")
+            self.state.set_failed_status(folder_key, [c['legacy_id'] for c in candidates], 'failed', reset_attempts=True)
+            downloaded = self._download_candidates_parallel(job, candidates)
+            downloaded += self._retry_failed_downloads(job)
+            print(f"   Recuperes: {downloaded}/{len(candidates)}")
+
+        self._write_dead_letter()
+        self.state.flush()
 
     def run_backend_single_job(self):
         """Run backend mode for single job"""
@@ -676,154 +2218,229 @@ class IndeedDownloader:
         input()
 
         job_url = self.driver.current_url
-        self.current_job_id = self._extract_job_id_from_url(job_url)
+        job = JobContext(job_id=self._extract_job_id_from_url(job_url))
 
         # Get job name from page
         try:
-            job_name = self.driver.execute_script("""
+            job.name = self.driver.execute_script("""
                 const el = document.querySelector('[data-testid="job-title"]') ||
                            document.querySelector('h1') ||
                            document.querySelector('.job-title');
                 return el ? el.textContent.trim() : 'Job';
             """)
-            self._create_job_folder(job_name)
-            print(f"📁 Dossier: {self.current_job_folder}")
+            self._create_job_folder(job)
+            print(f"📁 Dossier: {job.folder}")
         except Exception:
             pass
 
-        self._download_all_candidates_api()
+        self._download_all_candidates_api(job)
 
-    def _load_job_checkpoint(self, scan_pdfs: bool = False) -> tuple:
-        """Load checkpoint for current job folder - returns (downloaded_ids, downloaded_names)
+    def _fetch_candidates_batch(self, job: JobContext, dispositions: list, sort_by: str = "APPLY_DATE",
+                                sort_order: str = "DESCENDING", on_page=None) -> tuple:
+        """Fetch candidates with specific filters, all pages after the first at once, returns (candidates_list, total_count)
 
         Args:
-            scan_pdfs: If True, scan existing PDF files for names (for existing jobs with new candidates)
+            on_page: Optional callback receiving the new candidates of each page as soon as it is merged
         """
-        downloaded_ids = set(self.checkpoint_data.get('downloaded_ids', []))
-        downloaded_names = set(self.checkpoint_data.get('downloaded_names', []))
-
-        if not self.current_job_folder:
-            return downloaded_ids, downloaded_names
-
-        # Load from job-specific checkpoint if exists
-        job_checkpoint_file = self.current_job_folder / 'checkpoint.json'
-        if job_checkpoint_file.exists():
-            try:
-                with open(job_checkpoint_file, 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
-                    downloaded_ids.update(job_data.get('downloaded_ids', []))
-                    downloaded_names.update(job_data.get('downloaded_names', []))
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        # Scan existing PDF files to get names (only for existing jobs with new candidates)
-        if scan_pdfs:
-            print("   Scan des CVs existants...")
-            for pdf_file in self.current_job_folder.glob('*.pdf'):
-                # Format: "Jean Dupont_20251126_154317.pdf"
-                name_part = pdf_file.stem.rsplit('_', 2)[0]  # Get "Jean Dupont"
-                if name_part:
-                    downloaded_names.add(name_part.lower())
-            print(f"   {len(downloaded_names)} noms trouves dans les fichiers existants")
-
-        return downloaded_ids, downloaded_names
-
-    def _save_job_checkpoint(self, legacy_id: str, name: str = None):
-        """Save checkpoint for current job folder"""
-        if not self.current_job_folder:
-            return
+        all_candidates = {}  # Use dict to dedupe by legacy_id
+        page_size = self._get_page_size(job)
+
+        def fetch_page(offset: int, limit: int) -> tuple:
+            return self.fetch_candidates_api(job, offset=offset, limit=limit, dispositions=dispositions,
+                                             sort_by=sort_by, sort_order=sort_order)
+
+        def merge(matches: list):
+            page_candidates = []
+            for candidate in self._parse_matches(matches):
+                if candidate['legacy_id'] not in all_candidates:
+                    all_candidates[candidate['legacy_id']] = candidate
+                    page_candidates.append(candidate)
+            if on_page and page_candidates:
+                on_page(page_candidates)
+
+        for _ in range(PAGE_REFETCH_ROUNDS + 1):
+            matches, total_announced = fetch_page(0, page_size)
+            if matches is not None:
+                break
+        if not matches:
+            if matches is None:
+                self._add_listing_failures(job, 1)
+                print(f"   ⚠️  Premiere page de candidats en echec ({sort_by} {sort_order})")
+            return [], total_announced
+        merge(matches)
+
+        # The API may return less than asked for (clamped page size): step by what came back
+        end = min(total_announced, 3000)
+        step = len(matches)
+        pending = [(offset, min(step, end - offset)) for offset in range(step, end, step)]
+
+        for _ in range(PAGE_REFETCH_ROUNDS + 1):
+            if not pending or self._cancel.is_set():
+                break
+            futures = [(offset, limit, self.page_executor.submit(fetch_page, offset, limit))
+                       for offset, limit in pending]
+            pending = []
+            for offset, limit, future in futures:  # Offset order, so merging is deterministic
+                matches, _ = future.result()
+                if matches is None:
+                    pending.append((offset, limit))
+                    continue
+                merge(matches)
+                if matches and len(matches) < limit:  # Short page: only its missing part is fetched again
+                    pending.append((offset + len(matches), limit - len(matches)))
+                # An empty page means the list shrank since the first page: nothing left to fetch there
+
+        if pending:
+            self._add_listing_failures(job, len(pending))
+            print(f"   ⚠️  {len(pending)} page(s) de candidats en echec ({sort_by} {sort_order})")
+        return list(all_candidates.values()), total_announced
 
-        job_checkpoint_file = self.current_job_folder / 'checkpoint.json'
+    def _add_listing_failures(self, job: JobContext, count: int):
+        """Record listing pages lost for good (passes of a job run on several threads)"""
+        with self._stats_lock:
+            job.listing_failures += count
 
-        # Load existing
-        job_data = {'downloaded_ids': [], 'downloaded_names': []}
-        if job_checkpoint_file.exists():
+    def _parse_matches(self, matches: list) -> list:
+        """Candidate dicts {name, legacy_id, resume_id, download_url} from FindRCPMatches results, in order"""
+        candidates = []
+        for match in matches:
             try:
-                with open(job_checkpoint_file, 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
-                    if 'downloaded_names' not in job_data:
-                        job_data['downloaded_names'] = []
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        # Add new id
-        if legacy_id and legacy_id not in job_data['downloaded_ids']:
-            job_data['downloaded_ids'].append(legacy_id)
-
-        # Add new name
-        if name:
-            clean_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip().lower()
-            if clean_name and clean_name not in job_data['downloaded_names']:
-                job_data['downloaded_names'].append(clean_name)
+                sub = match.get('candidateSubmission', {})
+                data = sub.get('data', {})
+                name = data.get('profile', {}).get('name', {}).get('displayName', 'Unknown')
+                legacy_id = data.get('legacyID')
+                resume = data.get('resume', {})
+                download_url = resume.get('downloadUrl') if resume else None
+
+                if legacy_id:
+                    candidates.append({
+                        'name': name,
+                        'legacy_id': legacy_id,
+                        'resume_id': resume.get('id') if resume else None,
+                        'download_url': download_url  # Can be None if no CV
+                    })
+            except (KeyError, TypeError):
+                continue
+        return candidates
 
-        # Save
-        with open(job_checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(job_data, f, ensure_ascii=False, indent=2)
+    def _enumerate_new_candidates(self, job: JobContext, watermark_id: str, on_new=None) -> Optional[tuple]:
+        """List only the candidates who applied since the last sync of a job (newest first, up to the watermark)
 
-    def _fetch_candidates_batch(self, dispositions: list, sort_by: str = "APPLY_DATE", sort_order: str = "DESCENDING") -> tuple:
-        """Fetch candidates with specific filters, returns (candidates_list, total_count)"""
-        all_candidates = {}  # Use dict to dedupe by legacy_id
-        offset = 0
+        Returns (new_candidates_list, total_announced), or None if a page failed (then list everything).
+        """
+        all_dispositions = ["NEW", "PENDING", "PHONE_SCREENED", "INTERVIEWED", "OFFER_MADE", "REVIEWED"]
+        known_ids = self.state.candidate_ids(job.folder_key)
+        known_ids.add(watermark_id)
+        new_candidates = {}
         total_announced = 0
+        offset = 0
+        page_size = self._get_page_size(job)
 
         while True:
-            matches, total = self.fetch_candidates_api(
-                offset=offset,
-                limit=100,
-                dispositions=dispositions,
-                sort_by=sort_by,
-                sort_order=sort_order
-            )
-
+            matches, total = self.fetch_candidates_api(job, offset=offset, limit=page_size,
+                                                       dispositions=all_dispositions,
+                                                       sort_by="APPLY_DATE", sort_order="DESCENDING")
+            if matches is None:
+                return None
             if offset == 0:
                 total_announced = total
 
-            if not matches:
+            reached_known = False
+            for c in self._parse_matches(matches):
+                if c['legacy_id'] in known_ids:
+                    reached_known = True
+                    break
+                if c['legacy_id'] not in new_candidates:
+                    new_candidates[c['legacy_id']] = c
+                    if on_new:
+                        on_new(c)
+
+            if reached_known or not matches:
+                break
+            offset += len(matches)
+            if len(matches) < page_size and offset >= total_announced:
                 break
+            if offset >= 3000:
+                return None  # More new candidates than one listing can return
 
-            for match in matches:
-                try:
-                    sub = match.get('candidateSubmission', {})
-                    data = sub.get('data', {})
-                    name = data.get('profile', {}).get('name', {}).get('displayName', 'Unknown')
-                    legacy_id = data.get('legacyID')
-                    resume = data.get('resume', {})
-                    download_url = resume.get('downloadUrl') if resume else None
-
-                    if legacy_id and legacy_id not in all_candidates:
-                        all_candidates[legacy_id] = {
-                            'name': name,
-                            'legacy_id': legacy_id,
-                            'download_url': download_url  # Can be None if no CV
-                        }
-                except (KeyError, TypeError):
-                    continue
+        return list(new_candidates.values()), total_announced
 
-            if len(matches) < 100:
-                break
-            offset += 100
-            time.sleep(0.3)
+    def _get_page_size(self, job: JobContext) -> int:
+        """Candidates per listing request: PAGE_SIZE, or with PAGE_SIZE=auto the largest the API accepts
 
-        return list(all_candidates.values()), total_announced
+        The automatic size is probed once per run (on the first job listed).
+        """
+        if self.page_size:
+            return self.page_size
+        with self._page_size_lock:
+            if not self.page_size:
+                self.page_size = self._probe_page_size(job)
+        return self.page_size
 
-    def _download_all_candidates_api(self, job_total_candidates: int = 0):
-        """Download all candidates via API with multiple passes to bypass 3000 limit
+    def _probe_page_size(self, job: JobContext) -> int:
+        """Try PAGE_SIZE_CANDIDATES with ids-only requests, largest first
 
-        Args:
-            job_total_candidates: Total candidates from job listing (used to decide if we need multi-pass)
+        A limit the API rejects is skipped; one it silently clamps gives the clamped size.
         """
-        print("\nRecuperation des candidats via API...")
+        for limit in PAGE_SIZE_CANDIDATES:
+            matches, total = self.fetch_candidates_api(job, 0, limit, selection='ids', quiet=True)
+            if matches is None:
+                continue
+            page_size = len(matches) if 0 < len(matches) < min(limit, total) else limit
+            print(f"   Taille de page API: {page_size}")
+            return page_size
+        return 100
+
+    def _probe_disposition_counts(self, job: JobContext, dispositions: list, executor) -> dict:
+        """Get overallMatchCount per disposition with count-only requests
+
+        A failed probe counts as 3000 (possibly capped), so that disposition is still listed.
+        """
+        futures = {d: executor.submit(self.fetch_candidates_api, job, 0, 1, [d], selection='count')
+                   for d in dispositions}
+        counts = {}
+        for d, future in futures.items():
+            matches, total = future.result()
+            counts[d] = total if matches is not None else 3000
+        return counts
+
+    def _enumerate_candidates(self, job: JobContext, job_total_candidates: int = 0, on_new=None) -> tuple:
+        """List all candidates of a job, working around the 3000-result API cap
+
+        Args:
+            on_new: Optional callback receiving each new candidate as soon as its page arrives
 
+        Returns (all_candidates_list, total_expected)
+        """
         # All disposition types
         all_dispositions = ["NEW", "PENDING", "PHONE_SCREENED", "INTERVIEWED", "OFFER_MADE", "REVIEWED"]
         all_candidates = {}  # key: legacy_id, value: candidate dict
+        merge_lock = threading.Lock()
+
+        def fetch(dispositions: list, sort_by: str, sort_order: str) -> tuple:
+            """Fetch one slice, merging each page into all_candidates; returns (candidates, total, new_count)"""
+            new_total = 0
+
+            def merge_page(page: list):
+                nonlocal new_total
+                with merge_lock:
+                    new = [c for c in page if c['legacy_id'] not in all_candidates]
+                    for c in new:
+                        all_candidates[c['legacy_id']] = c
+                new_total += len(new)
+                if on_new:
+                    for c in new:
+                        on_new(c)
+
+            with self.profiler.span('phase.enum_pass', job=job.job_id, dispositions=len(dispositions),
+                                    sort=f"{sort_by} {sort_order}"):
+                candidates, total = self._fetch_candidates_batch(job, dispositions, sort_by, sort_order,
+                                                                 on_page=merge_page)
+            return candidates, total, new_total
 
         # Passe 1: Tri par date DESC (défaut)
         print("   Recuperation des candidats...")
-        candidates, api_total = self._fetch_candidates_batch(all_dispositions, "APPLY_DATE", "DESCENDING")
-        for c in candidates:
-            if c['legacy_id'] not in all_candidates:
-                all_candidates[c['legacy_id']] = c
+        _, api_total, _ = fetch(all_dispositions, "APPLY_DATE", "DESCENDING")
         print(f"      {len(all_candidates)} recuperes")
 
         # Use job_total_candidates if available (more accurate), otherwise use API total
@@ -831,158 +2448,215 @@ class IndeedDownloader:
 
         # Si on a tout récupéré ou si <= 3000 attendus, pas besoin de passes supplémentaires
         if len(all_candidates) >= total_expected or total_expected <= 3000:
-            pass  # On a tout, pas besoin de passes supplémentaires
-        else:
-            # Passes supplémentaires pour dépasser la limite de 3000
-            print(f"   Limite API atteinte ({len(all_candidates)}/{total_expected}), passes supplementaires...")
-
-            # Passe 2: Tri par date ASC
-            print("   Passe 2: Par date (ancien -> recent)...")
-            candidates, _ = self._fetch_candidates_batch(all_dispositions, "APPLY_DATE", "ASCENDING")
-            new_count = 0
-            for c in candidates:
-                if c['legacy_id'] not in all_candidates:
-                    all_candidates[c['legacy_id']] = c
-                    new_count += 1
+            return list(all_candidates.values()), total_expected
+
+        print(f"   Limite API atteinte ({len(all_candidates)}/{total_expected}), passes supplementaires...")
+
+        # Orders tried per disposition; pass 1 already has the newest, so oldest first
+        orders = [("APPLY_DATE", "ASCENDING"), ("APPLY_DATE", "DESCENDING"),
+                  ("NAME", "ASCENDING"), ("NAME", "DESCENDING")]
+
+        # Up to 6000 candidates: the oldest 3000 complete the newest 3000 from pass 1
+        if total_expected <= 6000:
+            print("   Par date (ancien -> recent)...")
+            _, _, new_count = fetch(all_dispositions, "APPLY_DATE", "ASCENDING")
             print(f"      +{new_count} nouveaux, total: {len(all_candidates)}")
+            if len(all_candidates) >= total_expected:
+                return list(all_candidates.values()), total_expected
+
+        with ThreadPoolExecutor(max_workers=self.enum_concurrency) as executor:
+            counts = self._probe_disposition_counts(job, all_dispositions, executor)
+            print("   Candidats par statut: " + ", ".join(f"{d}={n}" for d, n in counts.items() if n))
+
+            seen = {d: set() for d in all_dispositions}  # legacy_ids seen in slices of each disposition
+            remaining_orders = {d: list(orders) for d in all_dispositions if counts[d] > 0}
+
+            round_num = 0
+            while remaining_orders and len(all_candidates) < total_expected:
+                round_num += 1
+                slices = [(d, *remaining_orders[d].pop(0)) for d in all_dispositions if d in remaining_orders]
+                futures = [executor.submit(fetch, [d], sort_by, sort_order) for d, sort_by, sort_order in slices]
+
+                print(f"   Tour {round_num}: {len(slices)} tranches...")
+                for (disp, sort_by, sort_order), future in zip(slices, futures):
+                    candidates, _, new_count = future.result()
+                    seen[disp].update(c['legacy_id'] for c in candidates)
+                    yield_rate = new_count / len(candidates) if candidates else 0
+                    print(f"      {disp} ({sort_by} {sort_order}): +{new_count} "
+                          f"({len(seen[disp])}/{counts[disp]} couverts)")
+
+                    # A count of exactly 3000 may itself be capped, so it never proves coverage
+                    covered = len(seen[disp]) >= counts[disp] and counts[disp] < 3000
+                    if covered or yield_rate < self.planner_min_yield or not remaining_orders[disp]:
+                        del remaining_orders[disp]
+
+            # Last resort: all dispositions together, sorted by name
+            for sort_by, sort_order in [("NAME", "ASCENDING"), ("NAME", "DESCENDING")]:
+                if len(all_candidates) >= total_expected:
+                    break
+                candidates, _, new_count = fetch(all_dispositions, sort_by, sort_order)
+                print(f"      Tous statuts ({sort_by} {sort_order}): +{new_count}")
+                if not candidates or new_count / len(candidates) < self.planner_min_yield:
+                    break
 
-            # Passe 3: Tri par nom ASC (si encore manquant)
-            if len(all_candidates) < total_expected:
-                print("   Passe 3: Par nom (A -> Z)...")
-                candidates, _ = self._fetch_candidates_batch(all_dispositions, "NAME", "ASCENDING")
-                new_count = 0
-                for c in candidates:
-                    if c['legacy_id'] not in all_candidates:
-                        all_candidates[c['legacy_id']] = c
-                        new_count += 1
-                print(f"      +{new_count} nouveaux, total: {len(all_candidates)}")
-
-            # Passe 4: Tri par nom DESC (si encore manquant)
-            if len(all_candidates) < total_expected:
-                print("   Passe 4: Par nom (Z -> A)...")
-                candidates, _ = self._fetch_candidates_batch(all_dispositions, "NAME", "DESCENDING")
-                new_count = 0
-                for c in candidates:
-                    if c['legacy_id'] not in all_candidates:
-                        all_candidates[c['legacy_id']] = c
-                        new_count += 1
-                print(f"      +{new_count} nouveaux, total: {len(all_candidates)}")
-
-            # Passe 5: Par statut individuel (si >1000 manquants)
-            if len(all_candidates) < total_expected and (total_expected - len(all_candidates)) > 1000:
-                print("   Passe 5: Par statut individuel...")
-                for disp in all_dispositions:
-                    for sort_by in ["APPLY_DATE", "NAME"]:
-                        for sort_order in ["ASCENDING", "DESCENDING"]:
-                            candidates, _ = self._fetch_candidates_batch([disp], sort_by, sort_order)
-                            new_count = 0
-                            for c in candidates:
-                                if c['legacy_id'] not in all_candidates:
-                                    all_candidates[c['legacy_id']] = c
-                                    new_count += 1
-                            if new_count > 0:
-                                print(f"      {disp} ({sort_by} {sort_order}): +{new_count}")
-                print(f"      Total: {len(all_candidates)}")
-
-        all_candidates_list = list(all_candidates.values())
-
-        print(f"\n   Total attendu: {total_expected} | Recuperes: {len(all_candidates_list)}")
-
-        if len(all_candidates_list) == 0 and total_expected > 0:
+        print(f"      Total: {len(all_candidates)}")
+        return list(all_candidates.values()), total_expected
+
+    def _download_all_candidates_api(self, job: JobContext, job_total_candidates: int = 0):
+        """Download all candidates via API with multiple passes to bypass 3000 limit
+
+        Args:
+            job_total_candidates: Total candidates from job listing (used to decide if we need multi-pass)
+        """
+        print("\nRecuperation des candidats via API...")
+
+        # Index of already processed candidates (CVs + candidates without CV) from the state database
+        folder_key = job.folder_key
+        done_ids, done_resume_ids, unmatched_names = (
+            self.state.processed_index(folder_key) if job.folder else (set(), set(), set()))
+        job_row = self.state.job_row(folder_key) if job.folder else {}
+        incremental = self.sync_mode == 'incremental' and bool(job_row.get('watermark_id'))
+
+        to_download = queue.Queue(maxsize=self.max_in_flight)  # Blocks enumeration if downloads fall behind
+        candidates_no_cv = []
+        counts = {'already_processed': 0, 'with_cv': 0}
+        counts_lock = threading.Lock()
+        seen_ids = set()  # An incremental listing falling back to a full one reports candidates twice
+
+        def on_new(c: dict):
+            with counts_lock:
+                if c['legacy_id'] in seen_ids:
+                    return
+                seen_ids.add(c['legacy_id'])
+                if c['legacy_id'] in done_ids or (c['resume_id'] and c['resume_id'] in done_resume_ids):
+                    counts['already_processed'] += 1
+                    return  # Already processed
+                clean_name = clean_candidate_name(c['name'])
+                if clean_name in unmatched_names:
+                    # Row imported from a file name: matched by name once, by id from now on
+                    unmatched_names.discard(clean_name)
+                    self.state.adopt_name_row(folder_key, clean_name, c)
+                    counts['already_processed'] += 1
+                    return
+                if c['resume_id']:
+                    done_resume_ids.add(c['resume_id'])  # Same resume submitted twice to this job
+                if not c['download_url']:
+                    candidates_no_cv.append(c)
+                    return
+                counts['with_cv'] += 1
+            while True:
+                try:
+                    to_download.put(c, timeout=1)
+                    return
+                except queue.Full:
+                    if downloads.done():  # Consumer died, don't block enumeration forever
+                        raise RuntimeError("download workers stopped")
+
+        def close_queue():
+            while not downloads.done():
+                try:
+                    to_download.put(None, timeout=1)
+                    return
+                except queue.Full:
+                    continue
+
+        print(f"   Telechargement au fil de l'eau ({self.parallel_downloads} en parallele)...")
+        self._active_jobs[job.job_id] = job.name
+        self._download_queues[job.job_id] = to_download
+        try:
+            with ThreadPoolExecutor(max_workers=1) as consumer:
+                downloads = consumer.submit(self._run_download_engine, job, to_download)
+                try:
+                    listing = None
+                    job.listing_failures = 0
+                    with self.profiler.span('phase.enumerate', job=job.job_id, incremental=incremental):
+                        if incremental:
+                            listing = self._enumerate_new_candidates(job, job_row['watermark_id'], on_new=on_new)
+                            if listing is None:
+                                print("   Synchro incrementale impossible, liste complete...")
+                                incremental = False
+                        if listing is None:
+                            listing = self._enumerate_candidates(job, job_total_candidates, on_new=on_new)
+                    all_candidates_list, total_expected = listing
+                    close_queue()
+                    downloaded_count = downloads.result()
+                except KeyboardInterrupt:
+                    self._cancel.set()  # The download engine stops and flushes what it has
+                    raise
+                except Exception:
+                    close_queue()  # Let the queued downloads finish
+                    raise
+                finally:
+                    self._download_queues.pop(job.job_id, None)
+            with self.profiler.span('phase.retry_failed', job=job.job_id):
+                downloaded_count += self._retry_failed_downloads(job)
+        finally:
+            self._active_jobs.pop(job.job_id, None)
+        if not self._cancel.is_set():
+            self._inc_stat('jobs_completed')
+
+        already_processed = counts['already_processed']
+        if incremental:
+            print(f"\n   Nouveaux candidats depuis la derniere synchro: {len(all_candidates_list)}")
+        else:
+            print(f"\n   Total attendu: {total_expected} | Recuperes: {len(all_candidates_list)}")
+
+        if len(all_candidates_list) == 0 and total_expected > 0 and not incremental:
             print(f"   Aucun candidat recupere - job trop ancien ou donnees archivees")
-            self.stats['archived'] += 1
+            self._inc_stat('archived')
             return
 
-        if len(all_candidates_list) < total_expected:
+        if len(all_candidates_list) < total_expected and not incremental:
             missing = total_expected - len(all_candidates_list)
             pct = (len(all_candidates_list) / total_expected) * 100
             print(f"   Note: {missing} candidats non recuperes ({pct:.1f}% recuperes)")
 
-        # Load already processed names (PDFs + no_cv.txt)
-        processed_names = set()
-        if self.current_job_folder and self.current_job_folder.exists():
-            # Scan PDF files
-            for pdf_file in self.current_job_folder.glob('*.pdf'):
-                # Format: "Jean Dupont_20251126_154317.pdf"
-                name_part = pdf_file.stem.rsplit('_', 2)[0]  # Get "Jean Dupont"
-                if name_part:
-                    clean_name = "".join(ch for ch in name_part if ch.isalnum() or ch in (' ', '-', '_')).strip().lower()
-                    processed_names.add(clean_name)
-
-            # Load no_cv.txt (candidates without CV)
-            no_cv_file = self.current_job_folder / 'no_cv.txt'
-            if no_cv_file.exists():
-                with open(no_cv_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        name = line.strip()
-                        if name:
-                            clean_name = "".join(ch for ch in name if ch.isalnum() or ch in (' ', '-', '_')).strip().lower()
-                            processed_names.add(clean_name)
-
-        # Separate candidates with CV and without CV
-        candidates_with_cv = []
-        candidates_no_cv = []
-        already_processed = 0
-        for c in all_candidates_list:
-            clean_name = "".join(ch for ch in c['name'] if ch.isalnum() or ch in (' ', '-', '_')).strip().lower()
-            if clean_name in processed_names:
-                already_processed += 1
-                continue  # Already processed
-            if c['download_url']:
-                candidates_with_cv.append(c)
-            else:
-                candidates_no_cv.append(c)
-
-        # Save candidates without CV to no_cv.txt
-        if candidates_no_cv and self.current_job_folder:
-            no_cv_file = self.current_job_folder / 'no_cv.txt'
+        # Record candidates without CV (no_cv.txt is kept as a readable export)
+        if candidates_no_cv and job.folder:
+            for c in candidates_no_cv:
+                self.state.record_candidate(folder_key, 'no_cv', name=c['name'], legacy_id=c['legacy_id'])
+            no_cv_file = job.folder / 'no_cv.txt'
             with open(no_cv_file, 'a', encoding='utf-8') as f:
                 for c in candidates_no_cv:
                     f.write(c['name'] + '\n')
             print(f"   {len(candidates_no_cv)} candidats sans CV (sauvegardes dans no_cv.txt)")
 
-        print(f"\n   A telecharger: {len(candidates_with_cv)} | Deja fait: {already_processed} | Sans CV: {len(candidates_no_cv)}")
+        print(f"   Telecharges: {downloaded_count}/{counts['with_cv']} | Deja fait: {already_processed} | Sans CV: {len(candidates_no_cv)}")
+        if not counts['with_cv']:
+            print("   Tous les CVs sont deja telecharges!")
 
         # Use recovered count (not announced) - some candidates may be archived by Indeed
         total_recovered = len(all_candidates_list)
 
-        if not candidates_with_cv:
-            print("   Tous les CVs sont deja telecharges!")
-            # Save stats: announced, recovered, processed
-            self._save_job_stats(total_expected, total_recovered, already_processed + len(candidates_no_cv))
-            # Track job stats for report
+        # Save stats: announced, recovered, processed
+        total_processed = already_processed + len(candidates_no_cv) + downloaded_count
+        if incremental:
+            # Only the new candidates were listed: add them to the totals of the previous syncs
+            total_recovered += job_row.get('total_recovered') or 0
+            total_processed += job_row.get('processed') or 0
+        self._save_job_stats(job, total_expected, total_recovered, total_processed)
+
+        # The newest candidate listed becomes the job's watermark (listings are newest first), but only if
+        # every page was fetched: the next incremental sync stops there and would never see the missed ones.
+        # Fewer candidates than announced is normal (archived by Indeed) and does not count.
+        listing_complete = incremental or not job.listing_failures
+        if job.folder and all_candidates_list and not self._cancel.is_set():
+            if listing_complete:
+                self.state.upsert_job(folder_key, watermark_id=all_candidates_list[0]['legacy_id'],
+                                      synced_at=time.time())
+            else:
+                print("   Liste incomplete: repere de synchro incrementale non avance")
+
+        # Track job stats for report
+        with self._stats_lock:
             self.job_stats.append({
-                'job_name': self.current_job_name,
-                'downloaded': 0,
+                'job_name': job.name,
+                'downloaded': downloaded_count,
                 'skipped': already_processed,
                 'no_cv': len(candidates_no_cv),
                 'total_announced': total_expected,
                 'total_recovered': total_recovered
             })
-            return
-
-        print(f"\n   Telechargement...\n")
-
-        downloaded_count = 0
-        with tqdm(total=len(candidates_with_cv), desc="   CVs") as pbar:
-            for candidate in candidates_with_cv:
-                if self.download_cv_api(candidate):
-                    downloaded_count += 1
-                pbar.update(1)
-
-        # Save stats: announced, recovered, processed
-        total_processed = already_processed + len(candidates_no_cv) + downloaded_count
-        self._save_job_stats(total_expected, total_recovered, total_processed)
-
-        # Track job stats for report
-        self.job_stats.append({
-            'job_name': self.current_job_name,
-            'downloaded': downloaded_count,
-            'skipped': already_processed,
-            'no_cv': len(candidates_no_cv),
-            'total_announced': total_expected,
-            'total_recovered': total_recovered
-        })
 
     # ==================== FRONTEND MODE (Selenium) ====================
 
@@ -994,59 +2668,105 @@ class IndeedDownloader:
         print("=" * 60)
         input()
 
+        job = JobContext(job_id=self._extract_job_id_from_url(self.driver.current_url))
+
         # Get job name and create folder
         try:
-            job_name = self.driver.execute_script("""
+            job.name = self.driver.execute_script("""
                 const el = document.querySelector('[data-testid="job-title"]') ||
                            document.querySelector('h1');
                 return el ? el.textContent.trim() : 'Job';
             """)
-            self._create_job_folder(job_name)
-            print(f"📁 Dossier: {self.current_job_folder}")
+            self._create_job_folder(job)
+            print(f"📁 Dossier: {job.folder}")
         except Exception:
             pass
 
-        self._download_all_candidates_frontend()
+        self._download_all_candidates_frontend(job)
+
+    def _main_browser(self) -> BrowserContext:
+        """Frontend context of the main Chrome window, downloading into its own staging folder"""
+        if self.browser is None:
+            self.browser = BrowserContext(self.driver, self.staging_folder / 'browser-0')
+            self._set_download_dir(self.browser)
+        return self.browser
+
+    def _set_download_dir(self, browser: BrowserContext):
+        """Make a browser save its downloads into its own folder, each under its download GUID
+
+        With eventsEnabled, Browser.downloadWillBegin / downloadProgress events reach the
+        performance log, so completion is known without watching the folder.
+        """
+        browser.download_dir.mkdir(parents=True, exist_ok=True)
+        browser.driver.execute_cdp_cmd('Browser.setDownloadBehavior', {
+            'behavior': 'allowAndName',
+            'downloadPath': str(browser.download_dir.absolute()),
+            'eventsEnabled': True
+        })
 
-    def _download_all_candidates_frontend(self):
-        """Download candidates using Selenium clicks"""
+    def _open_worker_browsers(self, count: int) -> list:
+        """Start `count` headless Chrome instances logged in with the main browser's cookies"""
+        cookies = self._capture_browser_cookies() or self._load_saved_cookies()
+        browsers = []
+        for i in range(1, count + 1):
+            print(f"🌐 Ouverture du navigateur {i + 1} (headless)...")
+            try:
+                driver = webdriver.Chrome(options=self._chrome_options(headless=True))
+                driver.set_script_timeout(self.script_timeout)
+                self._inject_cookies(cookies, driver)
+            except Exception as e:
+                print(f"   ⚠️  Navigateur {i + 1} indisponible: {e}")
+                continue
+            browser = BrowserContext(driver, self.staging_folder / f'browser-{i}')
+            self._set_download_dir(browser)
+            browsers.append(browser)
+        return browsers
+
+    def _download_all_candidates_frontend(self, job: JobContext, browser: BrowserContext = None):
+        """Download candidates using Selenium clicks (in the main browser by default)"""
+        browser = browser or self._main_browser()
         print("\n🚀 Téléchargement via Selenium...\n")
 
-        pbar = tqdm(desc="CVs")
+        pbar = tqdm(desc="CVs", disable=self._jobs_running_concurrently)
         count = 0
+        self._active_jobs[job.job_id] = job.name
 
-        while count < self.max_cvs:
-            # Get candidate name
-            name = self._get_current_candidate_name()
-            if not name:
-                break
+        try:
+            while count < self.max_cvs and not self._cancel.is_set():
+                # Get candidate name
+                name = self._get_current_candidate_name(browser)
+                if not name:
+                    break
 
-            # Check if already downloaded
-            if name in self.checkpoint_data['downloaded_names']:
-                self.stats['skipped'] += 1
-            else:
-                # Download CV
-                if self._download_cv_frontend(name):
-                    self.stats['downloaded'] += 1
+                # Check if already downloaded
+                if name in self.state.downloaded_names:
+                    self._inc_stat('skipped')
                 else:
-                    self.stats['failed'] += 1
-
-            self.stats['total_processed'] += 1
-            count += 1
-            pbar.update(1)
-
-            # Go to next candidate
-            if not self._go_to_next_candidate():
-                break
+                    # Download CV
+                    with self.profiler.span('frontend.cv'):
+                        downloaded = self._download_cv_frontend(job, name, browser)
+                    if downloaded:
+                        self._inc_stat('downloaded')
+                    else:
+                        self._inc_stat('failed')
 
-            time.sleep(self.next_candidate_delay)
+                self._inc_stat('total_processed')
+                count += 1
+                pbar.update(1)
 
-        pbar.close()
+                # Go to next candidate (returns once its profile is shown)
+                if not self._go_to_next_candidate(browser):
+                    break
+        finally:
+            pbar.close()
+            self._active_jobs.pop(job.job_id, None)
+        if not self._cancel.is_set():
+            self._inc_stat('jobs_completed')
 
-    def _get_current_candidate_name(self) -> Optional[str]:
+    def _get_current_candidate_name(self, browser: BrowserContext) -> Optional[str]:
         """Get name from page"""
         try:
-            name = self.driver.execute_script("""
+            name = browser.driver.execute_script("""
                 const el = document.querySelector('[data-testid="name-plate-name-item"] span');
                 return el ? el.textContent.trim() : null;
             """)
@@ -1054,21 +2774,29 @@ class IndeedDownloader:
         except Exception:
             return None
 
-    def _download_cv_frontend(self, name: str) -> bool:
+    def _download_cv_frontend(self, job: JobContext, name: str, browser: BrowserContext) -> bool:
         """Download CV using click"""
+        driver = browser.driver
         try:
+            # Leftovers of a failed attempt would be taken for this candidate's CV
+            for leftover in browser.download_dir.iterdir():
+                leftover.unlink(missing_ok=True)
+            try:
+                driver.get_log('performance')  # Drop older events, only this click's download counts
+            except Exception:
+                pass
+
             # Find download button
             for attempt in range(3):
                 try:
-                    download_link = WebDriverWait(self.driver, 5).until(
+                    download_link = WebDriverWait(driver, 5).until(
                         EC.presence_of_element_located((
                             By.XPATH,
                             "//a[text()='Download resume' or text()='Télécharger le CV']"
                         ))
                     )
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_link)
-                    time.sleep(0.2)
-                    self.driver.execute_script("arguments[0].click();", download_link)
+                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_link)
+                    driver.execute_script("arguments[0].click();", download_link)
                     break
                 except StaleElementReferenceException:
                     if attempt == 2:
@@ -1077,39 +2805,99 @@ class IndeedDownloader:
                 except TimeoutException:
                     return False
 
-            time.sleep(self.download_delay)
-
-            # Verify and rename file
-            if self._verify_and_rename_download(name):
-                self._save_checkpoint(name=name)
+            # Wait for the download and move it to the job folder
+            with self.profiler.span('wait.download'):
+                filepath = self._verify_and_rename_download(job, name, browser)
+            if filepath:
+                self._save_checkpoint(job, name=name, file_path=filepath)
+                self._inc_stat('bytes_written', filepath.stat().st_size)
                 return True
             return False
 
         except Exception as e:
             return False
 
-    def _verify_and_rename_download(self, name: str) -> bool:
-        """Verify download and rename file"""
-        folder = self.current_job_folder or Path(self.download_folder)
-
-        for _ in range(10):
-            files = list(folder.glob("*.pdf"))
-            for f in files:
-                if f.stat().st_size > 1000 and name.split()[0].lower() not in f.name.lower():
-                    # Rename file
-                    safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    new_name = folder / f"{safe_name}_{timestamp}.pdf"
-                    f.rename(new_name)
-                    return True
-            time.sleep(0.5)
+    def _verify_and_rename_download(self, job: JobContext, name: str, browser: BrowserContext) -> Optional[Path]:
+        """Wait for the download started by the last click and move it to the job folder
 
-        return False
+        Completion comes from the CDP downloadProgress events; without one, see _stable_download.
 
-    def _go_to_next_candidate(self) -> bool:
+        Returns the final path (Name_YYYYmmdd_HHMMSS.pdf) or None on cancel/timeout.
+        """
+        deadline = time.monotonic() + self.download_verify_timeout
+        guids = set()
+        total_bytes = {}  # guid -> size announced by downloadProgress
+        stable_since = {}  # file -> (size, first time seen at that size)
+
+        while time.monotonic() < deadline:
+            completed = None
+            try:
+                entries = browser.driver.get_log('performance')
+            except Exception:
+                entries = []
+            for entry in entries:
+                try:
+                    message = json.loads(entry['message'])['message']
+                except (KeyError, TypeError, json.JSONDecodeError):
+                    continue
+                method, params = message.get('method'), message.get('params', {})
+                if method in ('Browser.downloadWillBegin', 'Page.downloadWillBegin'):
+                    guids.add(params.get('guid'))
+                elif method in ('Browser.downloadProgress', 'Page.downloadProgress') and params.get('guid') in guids:
+                    if params.get('totalBytes'):
+                        total_bytes[params['guid']] = params['totalBytes']
+                    if params.get('state') == 'completed':
+                        completed = browser.download_dir / params['guid']
+                    elif params.get('state') == 'canceled':
+                        return None
+
+            if completed is None:
+                completed = self._stable_download(browser, guids, total_bytes, stable_since)
+
+            if completed is not None and completed.exists():
+                if completed.stat().st_size <= 1000:
+                    completed.unlink()
+                    return None
+                filepath = self._reserve_cv_path(self._job_folder_or_default(job), name)
+                shutil.move(str(completed), str(filepath))
+                return filepath
+            time.sleep(0.1)
+
+        return None
+
+    def _stable_download(self, browser: BrowserContext, guids: set, total_bytes: dict,
+                         stable_since: dict) -> Optional[Path]:
+        """Fallback when no completion event arrives (the performance log may miss them)
+
+        A file counts as complete only with no .crdownload left in the browser's download
+        folder, its announced size reached, and no size change for DOWNLOAD_STABLE_SECONDS.
+        `stable_since` ({file: (size, since)}) is updated in place between polls.
+        """
+        now = time.monotonic()
+        files = list(browser.download_dir.iterdir())
+        if any(f.suffix == '.crdownload' for f in files):
+            stable_since.clear()
+            return None
+        files = [f for f in files if f.name in guids] or files
+        current = {}
+        for f in files:
+            try:
+                size = f.stat().st_size
+            except OSError:
+                continue
+            previous = stable_since.get(f)
+            current[f] = previous if previous and previous[0] == size else (size, now)
+        stable_since.clear()
+        stable_since.update(current)
+        return next((f for f, (size, since) in current.items()
+                     if size and size >= total_bytes.get(f.name, 0) and now - since >= DOWNLOAD_STABLE_SECONDS),
+                    None)
+
+    def _go_to_next_candidate(self, browser: BrowserContext) -> bool:
         """Navigate to next candidate"""
+        driver = browser.driver
         try:
-            current_index = self.driver.execute_script("""
+            current_index = driver.execute_script("""
                 const items = document.querySelectorAll('#hanselCandidateListContainer > div > ul > li[data-testid="CandidateListItem"]');
                 for (let i = 0; i < items.length; i++) {
                     if (items[i].getAttribute('aria-current') === 'true' || items[i].getAttribute('data-selected') === 'true') {
@@ -1123,7 +2911,7 @@ class IndeedDownloader:
                 return False
 
             # Click next candidate
-            clicked = self.driver.execute_script(f"""
+            clicked = driver.execute_script(f"""
                 const items = document.querySelectorAll('#hanselCandidateListContainer > div > ul > li[data-testid="CandidateListItem"]');
                 const nextItem = items[{current_index + 1}];
                 if (!nextItem) {{
@@ -1143,10 +2931,23 @@ class IndeedDownloader:
             """)
 
             if clicked == 'loading':
-                time.sleep(2)
-                return self._go_to_next_candidate()
-
-            return clicked == True
+                # Wait for the next page of candidates to be appended to the list
+                loaded = self._wait_until(driver, lambda d: d.execute_script("""
+                    return document.querySelectorAll('#hanselCandidateListContainer > div > ul > li[data-testid="CandidateListItem"]').length > arguments[0];
+                """, current_index + 1), 'candidate_list')
+                return bool(loaded) and self._go_to_next_candidate(browser)
+
+            if clicked == True:
+                # Selected in the list and its name shown in the profile pane
+                self._wait_until(driver, lambda d: d.execute_script("""
+                    const item = document.querySelectorAll('#hanselCandidateListContainer > div > ul > li[data-testid="CandidateListItem"]')[arguments[0]];
+                    const plate = document.querySelector('[data-testid="name-plate-name-item"] span');
+                    if (!item || !plate) return false;
+                    const selected = item.getAttribute('aria-current') === 'true' || item.getAttribute('data-selected') === 'true';
+                    return selected && item.textContent.includes(plate.textContent.trim());
+                """, current_index + 1), 'next_candidate')
+                return True
+            return False
 
         except Exception as e:
             return False
@@ -1294,16 +3095,14 @@ class IndeedDownloader:
                 return False
 
             # Scroll vers le bouton et cliquer
+            first_row = self.driver.find_element(By.CSS_SELECTOR, "tr[data-testid='job-row']")
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_btn)
-            time.sleep(0.5)
             next_btn.click()
-            time.sleep(3)
 
-            # Attendre que le tableau soit rechargé
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "tr[data-testid='job-row']"))
-            )
-            return True
+            # Attendre que le tableau soit remplace puis recharge
+            self._wait_until(self.driver, EC.staleness_of(first_row), 'job_page')
+            return bool(self._wait_until(self.driver, EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "tr[data-testid='job-row']")), 'job_page'))
         except Exception as e:
             print(f"      Erreur pagination: {e}")
         return False
@@ -1326,13 +3125,9 @@ class IndeedDownloader:
 
         print(f"   URL: {jobs_url}")
         self.driver.get(jobs_url)
-        time.sleep(4)
 
-        try:
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "tr[data-testid='job-row']"))
-            )
-        except TimeoutException:
+        if not self._wait_until(self.driver, EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "tr[data-testid='job-row']")), 'job_page'):
             print("Tableau des jobs non trouve")
             return []
 
@@ -1352,9 +3147,6 @@ class IndeedDownloader:
         while True:
             print(f"   Page {page}...")
 
-            # Attendre que les lignes soient chargées
-            time.sleep(1)
-
             jobs = self._extract_jobs_from_page()
 
             # Ne pas filtrer par statut ici car l'URL filtre déjà
@@ -1366,7 +3158,6 @@ class IndeedDownloader:
                 if not self._click_next_page():
                     break
                 page += 1
-                time.sleep(1)  # Attendre le chargement
             else:
                 break
 
@@ -1410,70 +3201,55 @@ class IndeedDownloader:
             s = re.sub(r'\s+', ' ', s).strip()
             return s
 
-        # Get all folders with their info
+        # Get all folders with their info (counts come from the state database)
+        on_disk = self._sync_job_folders()
+        summaries = self.state.job_summaries()
         folder_info = {}
-        for folder in download_path.iterdir():
-            if folder.is_dir():
-                # Format: "Nom du job (DD-MM-YYYY)"
-                match = re.match(r'(.+) \((\d{2}-\d{2}-\d{4})\)$', folder.name)
-                if match:
-                    job_name = match.group(1)
-                    date = match.group(2)
-                    clean_name = self._clean_job_title(job_name)
-                    normalized = normalize(clean_name)
-                    # Load stats from stats.json if exists, otherwise count PDFs
-                    stats = self._load_job_stats(folder)
-                    if stats:
-                        cv_count = stats.get('processed', 0)
-                        total_recovered = stats.get('total_recovered', cv_count)
-                    else:
-                        # Fallback: count PDFs + no_cv.txt entries
-                        cv_count = len(list(folder.glob('*.pdf')))
-                        no_cv_file = folder / 'no_cv.txt'
-                        if no_cv_file.exists():
-                            with open(no_cv_file, 'r', encoding='utf-8') as f:
-                                cv_count += sum(1 for line in f if line.strip())
-                        total_recovered = cv_count  # No stats, assume all processed
-                    folder_info[folder.name] = {
-                        'original_name': job_name,
-                        'clean_name': clean_name,
-                        'normalized_name': normalized,
-                        'date': date,
-                        'cv_count': cv_count,
-                        'total_recovered': total_recovered,
-                        'matched_job_id': None  # Track which job matched this folder
-                    }
-                else:
-                    clean_name = self._clean_job_title(folder.name)
-                    normalized = normalize(clean_name)
-                    # Load stats from stats.json if exists, otherwise count PDFs
-                    stats = self._load_job_stats(folder)
-                    if stats:
-                        cv_count = stats.get('processed', 0)
-                        total_recovered = stats.get('total_recovered', cv_count)
-                    else:
-                        # Fallback: count PDFs + no_cv.txt entries
-                        cv_count = len(list(folder.glob('*.pdf')))
-                        no_cv_file = folder / 'no_cv.txt'
-                        if no_cv_file.exists():
-                            with open(no_cv_file, 'r', encoding='utf-8') as f:
-                                cv_count += sum(1 for line in f if line.strip())
-                        total_recovered = cv_count  # No stats, assume all processed
-                    folder_info[folder.name] = {
-                        'original_name': folder.name,
-                        'clean_name': clean_name,
-                        'normalized_name': normalized,
-                        'date': None,
-                        'cv_count': cv_count,
-                        'total_recovered': total_recovered,
-                        'matched_job_id': None
-                    }
+        for folder_name in on_disk:
+            summary = summaries.get(folder_name, {})
+            # Format: "Nom du job (DD-MM-YYYY)"
+            match = re.match(r'(.+) \((\d{2}-\d{2}-\d{4})\)$', folder_name)
+            job_name = match.group(1) if match else folder_name
+            clean_name = self._clean_job_title(job_name)
+            if summary.get('processed') is not None:
+                cv_count = summary['processed']
+                total_recovered = summary.get('total_recovered') or cv_count
+            else:
+                # No stats yet: CVs + candidates without CV
+                cv_count = summary.get('downloaded', 0) + summary.get('no_cv', 0)
+                total_recovered = cv_count  # No stats, assume all processed
+            folder_info[folder_name] = {
+                'original_name': job_name,
+                'clean_name': clean_name,
+                'normalized_name': normalize(clean_name),
+                'date': match.group(2) if match else None,
+                'job_id': summary.get('job_id'),
+                'cv_count': cv_count,
+                'total_recovered': total_recovered,
+                'matched_job_id': None  # Track which job matched this folder
+            }
+
+        # Folders created by this version know their job id: match them directly
+        folders_by_job_id = {info['job_id']: name for name, info in folder_info.items() if info['job_id']}
+        for job in jobs:
+            folder_name = folders_by_job_id.get(job['id'])
+            if folder_name and folder_info[folder_name]['matched_job_id'] is None:
+                folder_info[folder_name]['matched_job_id'] = job['id']
+                existing[job['id']] = {
+                    'title': job['title'],
+                    'title_clean': job.get('title_clean', self._clean_job_title(job['title'])),
+                    'folder': folder_name,
+                    'cv_count': folder_info[folder_name]['cv_count'],
+                    'total_recovered': folder_info[folder_name]['total_recovered'],
+                    'total_candidates': job.get('total_candidates', 0),
+                    'date': job.get('date', '')
+                }
 
         print(f"\n   {len(folder_info)} dossiers trouves dans '{self.download_folder}/'")
 
         # Match jobs with folders - each folder can only match ONE job
         # First pass: match jobs that have exact name + date match (highest priority)
-        matched_count = 0
+        matched_count = len(existing)
         for job in jobs:
             job_clean = job.get('title_clean', self._clean_job_title(job['title']))
             job_normalized = normalize(job_clean)
@@ -1481,7 +3257,7 @@ class IndeedDownloader:
             job_id = job['id']
 
             # Only look for exact name + date matches in first pass
-            if not job_date:
+            if not job_date or job_id in existing:
                 continue
 
             for folder_name, info in folder_info.items():
@@ -1619,14 +3395,18 @@ class IndeedDownloader:
             print(f"   {len(jobs_with_new)} jobs avec nouveaux candidats")
         print(f"   {len(jobs_complete)} jobs complets")
         print()
-        print("Options:")
-        print("   [S] SkipAll - Ignorer TOUS les jobs existants")
-        print("   [N] NewOnly - Telecharger seulement les jobs avec nouveaux candidats")
-        print("   [K] KeepAll - Telecharger quand meme tous les jobs")
-        print()
+        # EXISTING_JOBS / --existing answers without asking
+        choice = {'skip': 'S', 'new': 'N', 'all': 'K'}.get(self.existing_jobs_policy)
+        if choice is None:
+            print("Options:")
+            print("   [S] SkipAll - Ignorer TOUS les jobs existants")
+            print("   [N] NewOnly - Telecharger seulement les jobs avec nouveaux candidats")
+            print("   [K] KeepAll - Telecharger quand meme tous les jobs")
+            print()
 
         while True:
-            choice = input("Votre choix (S/N/K): ").strip().upper()
+            if choice is None:
+                choice = input("Votre choix (S/N/K): ").strip().upper()
 
             if choice == 'S':
                 # Skip all existing
@@ -1648,6 +3428,7 @@ class IndeedDownloader:
                 return jobs
 
             print("Choix invalide, tapez S, N ou K")
+            choice = None
 
     def _filter_old_jobs(self, jobs: list) -> list:
         """Filter out jobs older than 2 years (Indeed archives candidate data after ~2 years)"""
@@ -1677,7 +3458,8 @@ class IndeedDownloader:
 
     def run_all_jobs(self):
         """Process all jobs"""
-        jobs = self.fetch_all_jobs()
+        with self.profiler.span('phase.job_list'):
+            jobs = self.fetch_all_jobs()
 
         if not jobs:
             print("Aucun job trouve")
@@ -1690,10 +3472,17 @@ class IndeedDownloader:
             print("Aucun job recent a traiter (tous > 2 ans)")
             return
 
+        if self.job_ids:
+            jobs = [j for j in jobs if j['id'] in self.job_ids]
+            missing = set(self.job_ids) - {j['id'] for j in jobs}
+            if missing:
+                print(f"   ⚠️  Job(s) introuvable(s): {', '.join(sorted(missing))}")
+
         # Check for existing folders (compare by name, not checkpoint)
         existing_jobs = self._find_existing_job_folders(jobs)
 
-        if existing_jobs:
+        # Incremental syncs are meant to revisit existing jobs, don't offer to skip them
+        if existing_jobs and self.sync_mode != 'incremental':
             jobs = self._ask_skip_existing_jobs(jobs, existing_jobs)
 
         if not jobs:
@@ -1703,32 +3492,190 @@ class IndeedDownloader:
         print(f"\n{len(jobs)} jobs a traiter")
         print("=" * 60)
 
-        for i, job in enumerate(jobs):
-            title_display = job.get('title_clean', job['title'])
-            print(f"\n[{i+1}/{len(jobs)}] {title_display}")
-            print(f"         Status: {job['status']}, Date: {job['date'] or 'N/A'}, Candidats: {job.get('total_candidates', '?')}")
+        if self.mode == 'backend' and self.job_concurrency > 1 and len(jobs) > 1:
+            # Close any modals that might appear
+            self._close_modals()
+            print(f"{min(self.job_concurrency, len(jobs))} jobs traites en parallele")
+            self._run_jobs_concurrently(jobs, self.job_concurrency, self._process_job)
+        elif self.mode == 'frontend' and self.frontend_browsers > 1 and len(jobs) > 1:
+            # One job per browser at a time; a browser takes the next job as soon as it is free
+            pool = [self._main_browser()] + self._open_worker_browsers(min(self.frontend_browsers, len(jobs)) - 1)
+            free_browsers = queue.Queue()
+            for browser in pool:
+                free_browsers.put(browser)
+
+            def process_on_free_browser(job_info: dict, index: int, total_jobs: int):
+                browser = free_browsers.get()
+                try:
+                    self._process_job(job_info, index, total_jobs, browser)
+                finally:
+                    free_browsers.put(browser)
+
+            print(f"{len(pool)} navigateurs en parallele")
+            try:
+                self._run_jobs_concurrently(jobs, len(pool), process_on_free_browser)
+            finally:
+                for browser in pool[1:]:
+                    browser.driver.quit()
+        else:
+            for i, job in enumerate(jobs):
+                self._process_job(job, i, len(jobs))
+
+    def _run_jobs_concurrently(self, jobs: list, max_workers: int, process_job):
+        """Run process_job(job_info, index, total_jobs) for every job on `max_workers` threads"""
+        self._jobs_running_concurrently = True
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(process_job, job, i, len(jobs)) for i, job in enumerate(jobs)]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except KeyboardInterrupt:
+                    # Job threads don't see Ctrl-C: stop their requests and downloads
+                    self._cancel.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            self._jobs_running_concurrently = False
+
+    def _process_job(self, job_info: dict, index: int, total_jobs: int, browser: BrowserContext = None):
+        """Download every candidate of one job from the job list
+
+        Args:
+            browser: Frontend mode browser to use (the main one by default)
+        """
+        title_display = job_info.get('title_clean', job_info['title'])
+        print(f"\n[{index+1}/{total_jobs}] {title_display}")
+        print(f"         Status: {job_info['status']}, Date: {job_info['date'] or 'N/A'}, Candidats: {job_info.get('total_candidates', '?')}")
 
-            self.current_job_id = job['id']
-            self.current_job_name = job['title']
-            self._create_job_folder(job['title'], job['date'])
+        job = JobContext(job_id=job_info['id'], name=job_info['title'])
+        self._create_job_folder(job, job_info['date'])
 
+        with self.profiler.span('phase.job', job=job.job_id, mode=self.mode):
             if self.mode == 'backend':
-                # Close any modals that might appear
-                self._close_modals()
-                self._download_all_candidates_api(job.get('total_candidates', 0))
+                if not self._jobs_running_concurrently:
+                    # Close any modals that might appear
+                    self._close_modals()
+                self._download_all_candidates_api(job, job_info.get('total_candidates', 0))
             else:
+                browser = browser or self._main_browser()
                 # Navigate to job
-                self.driver.get(f"https://employers.indeed.com/candidates?selectedJobs={job['id']}")
-                time.sleep(3)
+                browser.driver.get(f"https://employers.indeed.com/candidates?selectedJobs={job_info['id']}")
+                self._wait_until(browser.driver, EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "[data-testid='name-plate-name-item']")), 'candidate_page')
                 # Close any modals that might appear
-                self._close_modals()
-                self._download_all_candidates_frontend()
+                self._close_modals(browser.driver)
+                self._download_all_candidates_frontend(job, browser)
 
-            self._save_checkpoint(job_id=job['id'])
-            print(f"   Job termine: {title_display}")
+        if self._cancel.is_set():
+            return  # Interrupted: not completed
+        self._save_checkpoint(job_id=job_info['id'])
+        self.state.flush()
+        print(f"   Job termine: {title_display}")
 
     # ==================== MAIN ====================
 
+    def _start_metrics_server(self):
+        """Serve live metrics in the Prometheus text format on METRICS_HOST:METRICS_PORT (/metrics)"""
+        if not self.metrics_port:
+            return
+        downloader = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if urlparse(self.path).path not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = downloader._metrics_text().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes would clutter the progress output
+
+        try:
+            self.metrics_server = ThreadingHTTPServer((self.metrics_host, self.metrics_port), MetricsHandler)
+        except OSError as e:
+            print(f"⚠️  Metriques indisponibles sur le port {self.metrics_port}: {e}")
+            return
+        self.metrics_server.daemon_threads = True
+        threading.Thread(target=self.metrics_server.serve_forever, name='metrics', daemon=True).start()
+        print(f"📈 Metriques: http://{self.metrics_host}:{self.metrics_port}/metrics")
+
+    def _metrics_text(self) -> str:
+        """Current counters and gauges in the Prometheus text exposition format"""
+        lines = []
+
+        def escape(value) -> str:
+            return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        def metric(name: str, kind: str, help_text: str, samples: list):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{k}="{escape(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        with self._stats_lock:
+            stats = dict(self.stats)
+        counters = [
+            ('downloaded', "CVs downloaded"), ('skipped', "CVs skipped (already downloaded)"),
+            ('archived', "Jobs without candidates (archived by Indeed)"),
+            ('api_calls', "GraphQL requests sent"), ('retries', "Calls retried after a 429/5xx/network error"),
+            ('reused', "CVs linked from the CV store without downloading"),
+            ('deduplicated', "Downloaded CVs identical to a stored one"),
+            ('bytes_written', "Bytes of CVs written"),
+        ]
+        for key, help_text in counters:
+            metric(f"indeed_{key}_total", 'counter', help_text, [({}, stats[key])])
+        metric("indeed_jobs_completed_total", 'counter', "Jobs fully processed", [({}, stats['jobs_completed'])])
+        # Not a counter: a CV recovered by an end-of-job retry round leaves this count
+        metric("indeed_failed", 'gauge', "CVs currently failed (queued for a retry or dead-lettered)",
+               [({}, stats['failed'])])
+        metric("indeed_current_job", 'gauge', "Jobs being downloaded (1 per job)",
+               [({'job_id': job_id, 'name': name}, 1) for job_id, name in list(self._active_jobs.items())])
+        metric("indeed_download_queue_depth", 'gauge', "Candidates listed and waiting for a download worker",
+               [({'job_id': job_id}, q.qsize()) for job_id, q in list(self._download_queues.items())])
+
+        limiter = self.limiter
+        metric("indeed_requests_in_flight", 'gauge', "Calls to Indeed in flight", [({}, limiter.in_flight)])
+        metric("indeed_limiter_rate", 'gauge', "Current request rate allowed by the limiter (per second)",
+               [({}, round(limiter.rate, 3))])
+        metric("indeed_limiter_concurrency", 'gauge', "Current concurrency window of the limiter",
+               [({}, round(limiter.concurrency, 3))])
+        metric("indeed_limiter_paused_seconds", 'gauge', "Seconds left in the limiter's 429 cooldown",
+               [({}, round(max(0.0, limiter._paused_until - time.monotonic()), 3))])
+        if self.start_time:
+            metric("indeed_run_elapsed_seconds", 'gauge', "Seconds since the run started",
+                   [({}, round(time.time() - self.start_time, 1))])
+        lines.extend(self.request_latency.render("indeed_request_duration_seconds"))
+        return '\n'.join(lines) + '\n'
+
+    def _write_profile(self):
+        """Save the run profile (settings, stats, timing percentiles, counters) as JSON, to compare runs"""
+        if not self.profiler.enabled:
+            return
+        profile = {
+            'started': datetime.fromtimestamp(self.profiler.started).isoformat(timespec='seconds'),
+            'elapsed_s': round(time.time() - self.profiler.started, 3),
+            'settings': {
+                'mode': self.mode, 'job_mode': self.job_mode, 'transport': self.transport, 'engine': self.engine,
+                'parallel_downloads': self.parallel_downloads, 'async_concurrency': self.async_concurrency,
+                'download_batch_size': self.download_batch_size, 'api_rate': self.api_rate,
+                'job_concurrency': self.job_concurrency, 'sync_mode': self.sync_mode,
+            },
+            'stats': dict(self.stats),
+            **self.profiler.summary(),
+        }
+        self.profiler.close()
+        with open(self.profile_file, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, indent=2, ensure_ascii=False)
+        print(f"Profil: {self.profile_file}")
+
     def print_statistics(self):
         """Print final statistics"""
         print("\n" + "=" * 60)
@@ -1738,9 +3685,21 @@ class IndeedDownloader:
         print(f"Telecharges:    {self.stats['downloaded']}")
         print(f"Ignores:        {self.stats['skipped']}")
         print(f"Echecs:         {self.stats['failed']}")
+        print(f"Requetes API:   {self.stats['api_calls']}")
+        if self.stats['retries'] > 0:
+            print(f"Reessais:       {self.stats['retries']}")
+        if self.stats['reused'] or self.stats['deduplicated']:
+            print(f"Reutilises:     {self.stats['reused']} (sans telechargement), {self.stats['deduplicated']} doublons")
         if self.stats['archived'] > 0:
             print(f"Jobs archives:  {self.stats['archived']} (donnees non disponibles)")
 
+        profile = self.profiler.summary()
+        if profile['timings']:
+            print("\nProfil (10 postes les plus longs):")
+            print(f"   {'':<24} {'nombre':>7} {'total':>9} {'p50':>9} {'p99':>9}")
+            for name, t in list(profile['timings'].items())[:10]:
+                print(f"   {name:<24} {t['count']:>7} {t['total_s']:>8.1f}s {t['p50_ms']:>7.0f}ms {t['p99_ms']:>7.0f}ms")
+
         if self.start_time:
             elapsed = time.time() - self.start_time
             hours = int(elapsed // 3600)
@@ -1758,35 +3717,30 @@ class IndeedDownloader:
         self._generate_report()
 
     def _generate_report(self):
-        """Generate a summary report file by scanning all job folders in downloads"""
+        """Generate a summary report file from the state database"""
         report_file = Path(self.download_folder) / 'rapport_telechargement.txt'
         timestamp = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
 
-        # Scan all job folders in downloads
-        download_path = Path(self.download_folder)
+        # One row per job folder still present in downloads
+        on_disk = self._sync_job_folders()
+        summaries = self.state.job_summaries()
         job_folders = []
 
-        for folder in sorted(download_path.iterdir()):
-            if folder.is_dir():
-                # Count PDFs
-                pdf_count = len(list(folder.glob('*.pdf')))
-
-                # Count no_cv.txt entries
-                no_cv_count = 0
-                no_cv_file = folder / 'no_cv.txt'
-                if no_cv_file.exists():
-                    with open(no_cv_file, 'r', encoding='utf-8') as f:
-                        no_cv_count = sum(1 for line in f if line.strip())
-
-                # Load stats.json if exists
-                stats = self._load_job_stats(folder)
-
-                job_folders.append({
-                    'name': folder.name,
-                    'pdf_count': pdf_count,
-                    'no_cv_count': no_cv_count,
-                    'stats': stats
-                })
+        for folder_name in sorted(on_disk):
+            summary = summaries.get(folder_name, {})
+            stats = None
+            if summary.get('total_announced') is not None:
+                stats = {
+                    'total_announced': summary['total_announced'] or 0,
+                    'total_recovered': summary.get('total_recovered') or 0,
+                    'processed': summary.get('processed') or 0
+                }
+            job_folders.append({
+                'name': folder_name,
+                'pdf_count': summary.get('downloaded', 0),
+                'no_cv_count': summary.get('no_cv', 0),
+                'stats': stats
+            })
 
         if not job_folders:
             print("Aucun dossier job trouve dans downloads/")
@@ -1842,17 +3796,36 @@ class IndeedDownloader:
 
         print(f"\nRapport genere: {report_file}")
 
-    def run(self):
-        """Main execution"""
+    def run(self, retry_failed: bool = False) -> int:
+        """Main execution
+
+        Args:
+            retry_failed: Only re-download the CVs that failed in previous runs (backend mode, no menu)
+
+        Returns:
+            Process exit code (EXIT_OK, EXIT_FAILURES if some CVs failed, EXIT_AUTH, EXIT_ERROR, EXIT_INTERRUPTED)
+        """
+        exit_code = EXIT_OK
         try:
-            self.show_menu()
+            if retry_failed:
+                self.mode = 'backend'
+                self.headless = self.headless or not self.interactive
+            elif self.interactive:
+                self.show_menu()
+            else:
+                self._apply_batch_settings()
 
-            if not self.setup_chrome():
-                return
+            self._start_metrics_server()
+            with self.profiler.span('phase.setup'):
+                logged_in = self.setup_chrome()
+            if not logged_in:
+                return EXIT_AUTH
 
             self.start_time = time.time()
 
-            if self.job_mode == 'single':
+            if retry_failed:
+                self.run_retry_failed()
+            elif self.job_mode == 'single':
                 if self.mode == 'backend':
                     self.run_backend_single_job()
                 else:
@@ -1861,25 +3834,80 @@ class IndeedDownloader:
                 self.run_all_jobs()
 
             self.print_statistics()
+            if self.stats['failed'] > 0:
+                exit_code = EXIT_FAILURES
 
         except KeyboardInterrupt:
             print("\n\n⚠️ Interrompu par l'utilisateur")
             self.print_statistics()
+            exit_code = EXIT_INTERRUPTED
 
         except Exception as e:
             print(f"\n❌ Erreur: {e}")
             import traceback
             traceback.print_exc()
+            exit_code = EXIT_ERROR
 
         finally:
+            self.download_executor.shutdown(wait=True)
+            self.page_executor.shutdown(wait=True)
+            if self.metrics_server:
+                self.metrics_server.shutdown()
+            self._write_profile()
+            self.state.close()
             if self.driver:
-                input("\nAppuyez sur Entrée pour fermer Chrome...")
+                if self.interactive and not self.headless:
+                    input("\nAppuyez sur Entrée pour fermer Chrome...")
                 self.driver.quit()
 
+        return exit_code
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Indeed CV Downloader")
+    parser.add_argument('--retry-failed', action='store_true',
+                        help="Re-download only the CVs that failed in previous runs (see logs/dead_letter.jsonl)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only list candidates newer than the last sync of each job (same as SYNC_MODE=incremental)")
+    parser.add_argument('--batch', action='store_true',
+                        help="Non-interactive run for cron: no menu or prompts, headless Chrome, saved cookies required")
+    parser.add_argument('--mode', choices=['backend', 'frontend'],
+                        help="Download mode (same as DOWNLOAD_MODE; default in batch: backend)")
+    parser.add_argument('--statuses',
+                        help="Job statuses to process, e.g. open,paused (same as JOB_STATUSES; default in batch: open,paused)")
+    parser.add_argument('--jobs',
+                        help="Comma-separated job ids to process instead of every job (same as JOB_IDS)")
+    parser.add_argument('--existing', choices=['ask', 'skip', 'new', 'all'],
+                        help="Jobs already downloaded: skip them, only those with new candidates, or all "
+                             "(same as EXISTING_JOBS; default in batch: new)")
+    parser.add_argument('--metrics-port', type=int,
+                        help="Serve live Prometheus metrics on this local port (same as METRICS_PORT)")
+    parser.add_argument('--headless', action='store_true',
+                        help="Run Chrome without a window (same as HEADLESS=true; saved cookies required)")
+    args = parser.parse_args()
+
     downloader = IndeedDownloader()
-    downloader.run()
+    if args.incremental:
+        downloader.sync_mode = 'incremental'
+    if args.mode:
+        downloader.mode = args.mode
+    if args.statuses:
+        downloader.job_statuses = downloader._parse_job_statuses(args.statuses)
+    if args.jobs:
+        downloader.job_ids = [j.strip() for j in args.jobs.split(',') if j.strip()]
+    if args.existing:
+        downloader.existing_jobs_policy = args.existing
+    if args.headless:
+        downloader.headless = True
+    if args.metrics_port:
+        downloader.metrics_port = args.metrics_port
+    if args.batch:
+        downloader.interactive = False
+    if downloader.mode not in (None, 'backend', 'frontend'):
+        parser.error(f"DOWNLOAD_MODE: invalid choice: '{downloader.mode}' (choose from 'backend', 'frontend')")
+    if downloader.job_statuses or downloader.job_ids:
+        downloader.job_mode = 'all'  # Statuses and job ids only apply to the job list
+    sys.exit(downloader.run(retry_failed=args.retry_failed))
 
 
 if __name__ == "__main__":